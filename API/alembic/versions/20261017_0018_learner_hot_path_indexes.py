@@ -0,0 +1,53 @@
+"""add composite indexes for learner hot-path filters
+
+Revision ID: 20261017_0018
+Revises: 20260228_0017
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0018"
+down_revision = "20260228_0017"
+branch_labels = None
+depends_on = None
+
+
+def _has_table(inspector, table_name: str) -> bool:
+    return inspector.has_table(table_name)
+
+
+def _has_index(inspector, table_name: str, index_name: str) -> bool:
+    return any(ix.get("name") == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    # Login streak: learner_id + event_type filter, ordered by created_at.
+    if _has_table(inspector, "engagement_events") and not _has_index(
+        inspector, "engagement_events", "idx_engagement_events_learner_type_created"
+    ):
+        op.create_index(
+            "idx_engagement_events_learner_type_created",
+            "engagement_events",
+            ["learner_id", "event_type", "created_at"],
+        )
+    # Weekly adherence: learner_id + created_at window over tasks.
+    if _has_table(inspector, "tasks") and not _has_index(inspector, "tasks", "idx_tasks_learner_created"):
+        op.create_index("idx_tasks_learner_created", "tasks", ["learner_id", "created_at"])
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _has_table(inspector, "tasks") and _has_index(inspector, "tasks", "idx_tasks_learner_created"):
+        op.drop_index("idx_tasks_learner_created", table_name="tasks")
+    if _has_table(inspector, "engagement_events") and _has_index(
+        inspector, "engagement_events", "idx_engagement_events_learner_type_created"
+    ):
+        op.drop_index("idx_engagement_events_learner_type_created", table_name="engagement_events")
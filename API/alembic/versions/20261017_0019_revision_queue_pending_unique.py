@@ -0,0 +1,59 @@
+"""enforce one pending revision_queue row per learner chapter
+
+Revision ID: 20261017_0019
+Revises: 20261017_0018
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0019"
+down_revision = "20261017_0018"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "uq_revision_queue_learner_chapter_pending"
+
+
+def _has_table(inspector, table_name: str) -> bool:
+    return inspector.has_table(table_name)
+
+
+def _has_index(inspector, table_name: str, index_name: str) -> bool:
+    return any(ix.get("name") == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "revision_queue") or _has_index(inspector, "revision_queue", INDEX_NAME):
+        return
+    # Collapse duplicate pending rows left by the old select-then-insert upsert,
+    # keeping the highest-priority (then earliest-queued) entry per chapter.
+    op.execute(
+        "DELETE FROM revision_queue WHERE id IN ("
+        "SELECT id FROM ("
+        "SELECT id, row_number() OVER ("
+        "PARTITION BY learner_id, chapter "
+        "ORDER BY priority DESC, created_at ASC NULLS LAST, id"
+        ") AS rn FROM revision_queue WHERE status = 'pending'"
+        ") ranked WHERE rn > 1)"
+    )
+    op.create_index(
+        INDEX_NAME,
+        "revision_queue",
+        ["learner_id", "chapter"],
+        unique=True,
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if _has_table(inspector, "revision_queue") and _has_index(inspector, "revision_queue", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="revision_queue")
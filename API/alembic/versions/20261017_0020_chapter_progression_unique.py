@@ -0,0 +1,61 @@
+"""enforce one chapter_progression row per learner chapter
+
+Revision ID: 20261017_0020
+Revises: 20261017_0019
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0020"
+down_revision = "20261017_0019"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "uq_chapter_progression_learner_chapter"
+LEGACY_INDEX_NAME = "idx_chapter_progression_learner_chapter"
+
+
+def _has_table(inspector, table_name: str) -> bool:
+    return inspector.has_table(table_name)
+
+
+def _has_index(inspector, table_name: str, index_name: str) -> bool:
+    return any(ix.get("name") == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "chapter_progression"):
+        return
+    if not _has_index(inspector, "chapter_progression", INDEX_NAME):
+        # Collapse duplicate rows left by the old select-then-insert seeding, keeping
+        # the row with the most progress (a fresh seeded row never beats real attempts).
+        op.execute(
+            "DELETE FROM chapter_progression WHERE id IN ("
+            "SELECT id FROM ("
+            "SELECT id, row_number() OVER ("
+            "PARTITION BY learner_id, chapter "
+            "ORDER BY attempt_count DESC, best_score DESC, updated_at DESC NULLS LAST, id"
+            ") AS rn FROM chapter_progression"
+            ") ranked WHERE rn > 1)"
+        )
+        op.create_index(INDEX_NAME, "chapter_progression", ["learner_id", "chapter"], unique=True)
+    if _has_index(inspector, "chapter_progression", LEGACY_INDEX_NAME):
+        op.drop_index(LEGACY_INDEX_NAME, table_name="chapter_progression")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "chapter_progression"):
+        return
+    if not _has_index(inspector, "chapter_progression", LEGACY_INDEX_NAME):
+        op.create_index(LEGACY_INDEX_NAME, "chapter_progression", ["learner_id", "chapter"])
+    if _has_index(inspector, "chapter_progression", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="chapter_progression")
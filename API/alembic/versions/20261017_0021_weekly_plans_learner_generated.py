@@ -0,0 +1,51 @@
+"""index latest weekly plan lookups by learner and generation time
+
+Revision ID: 20261017_0021
+Revises: 20261017_0020
+Create Date: 2026-10-17
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261017_0021"
+down_revision = "20261017_0020"
+branch_labels = None
+depends_on = None
+
+INDEX_NAME = "idx_weekly_plans_learner_generated"
+LEGACY_INDEX_NAME = "idx_weekly_plans_learner_id"
+
+
+def _has_table(inspector, table_name: str) -> bool:
+    return inspector.has_table(table_name)
+
+
+def _has_index(inspector, table_name: str, index_name: str) -> bool:
+    return any(ix.get("name") == index_name for ix in inspector.get_indexes(table_name))
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "weekly_plans"):
+        return
+    # WHERE learner_id = ? ORDER BY generated_at DESC LIMIT 1 becomes a backward index scan.
+    if not _has_index(inspector, "weekly_plans", INDEX_NAME):
+        op.create_index(INDEX_NAME, "weekly_plans", ["learner_id", "generated_at"])
+    if _has_index(inspector, "weekly_plans", LEGACY_INDEX_NAME):
+        op.drop_index(LEGACY_INDEX_NAME, table_name="weekly_plans")
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not _has_table(inspector, "weekly_plans"):
+        return
+    if not _has_index(inspector, "weekly_plans", LEGACY_INDEX_NAME):
+        op.create_index(LEGACY_INDEX_NAME, "weekly_plans", ["learner_id"])
+    if _has_index(inspector, "weekly_plans", INDEX_NAME):
+        op.drop_index(INDEX_NAME, table_name="weekly_plans")
@@ -4,12 +4,12 @@ Diagnostic MCQ Agent — generates MCQ questions for a topic using LLM + NCERT g
 Can generate questions for question_bank or on-the-fly tests. Uses template fallback
 when LLM is unavailable.
 """
-import json
 import logging
 import random
 from typing import TYPE_CHECKING
 from sqlalchemy import select
 from app.agents.base import BaseAgent
+from app.core.json_parser import extract_json_array
 from app.core.llm_provider import get_llm_provider
 from app.models.entities import QuestionBank
 
@@ -95,11 +95,8 @@ class DiagnosticMCQAgent(BaseAgent):
             try:
                 llm_text, _ = await self.provider.generate(prompt)
                 if llm_text:
-                    text = llm_text.strip()
-                    start = text.find("[")
-                    end = text.rfind("]") + 1
-                    if start >= 0 and end > start:
-                        parsed = json.loads(text[start:end])
+                    parsed = extract_json_array(llm_text)
+                    if parsed is not None:
                         for i, item in enumerate(parsed[:count]):
                             options = item.get("options", ["A", "B", "C", "D"])
                             correct_idx = int(item.get("correct", 0))
@@ -1,6 +1,7 @@
 """Auth API: signup and login for students (PLANNER_FINAL_FEATURES)."""
 from datetime import date
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 from sqlalchemy import select
@@ -94,7 +95,6 @@ async def start_signup(payload: StartSignupRequest, db: AsyncSession = Depends(g
     if duplicate_email:
         raise HTTPException(status_code=400, detail="Email already registered. Please use a different email.")
 
-    import json
     from uuid import uuid4
 
     draft_id = str(uuid4())
@@ -110,7 +110,7 @@ async def start_signup(payload: StartSignupRequest, db: AsyncSession = Depends(g
     try:
         await redis_client.set(
             f"signup:draft:{draft_id}",
-            json.dumps(draft),
+            orjson.dumps(draft),
             ex=SIGNUP_DRAFT_TTL,
         )
     except Exception:
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.memory.database import get_db
 from app.rag.grounding_ingest import ensure_grounding_ready, run_grounding_ingestion
+from app.services.diagnostic_chunks import invalidate_diagnostic_chunks_cache
 
 router = APIRouter(prefix="/grounding", tags=["grounding"])
 logger = logging.getLogger(__name__)
@@ -23,5 +24,6 @@ async def grounding_ingest(
 ):
     logger.info("POST /grounding/ingest requested (force_rebuild=%s)", force_rebuild)
     summary = await run_grounding_ingestion(db, force_rebuild=force_rebuild)
+    invalidate_diagnostic_chunks_cache()
     ready, detail = await ensure_grounding_ready(db)
     return {"ingestion": summary, "ready": ready, "validation": detail}
@@ -12,17 +12,19 @@ import math
 import random
 import re
 import asyncio
-from difflib import SequenceMatcher
 from datetime import datetime, timedelta, timezone
+from statistics import fmean
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from pydantic import BaseModel, Field
-from sqlalchemy import desc, func, select, update
+from sqlalchemy import desc, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.json_parser import extract_json_array
 from app.core.llm_provider import get_llm_provider
 from app.core.logging import DOMAIN_COMPLIANCE, get_domain_logger
+from app.core.responses import ORJSONResponse
 from app.core.settings import settings
 from app.core.timeline import (
     TIMELINE_TZ,
@@ -73,6 +75,11 @@ TEST_PROMPT_VERSION = "v2"
 
 
 from app.services.shared_helpers import generate_text_with_mcp as _generate_text_with_mcp  # noqa: E402
+from app.services.shared_helpers import (  # noqa: E402
+    delete_cache_key_quietly,
+    log_agent_decision_detached,
+    run_detached,
+)
 
 # ── Extracted service modules (canonical implementations) ────────────
 # These modules contain the extracted helper logic. The inline helpers
@@ -85,6 +92,7 @@ from app.services.math_formatting import (  # noqa: E402, F401
 )
 from app.services.question_quality import (  # noqa: E402, F401
     dedupe_generated_questions,
+    is_near_duplicate,
     question_set_is_high_quality,
     reading_content_is_high_quality,
 )
@@ -302,56 +310,50 @@ def _merge_replanned_future(
     return preserved + future
 
 
-def _build_week_tasks_for_chapter(*, learner_id: UUID, week_number: int, chapter_number: int) -> list[Task]:
-    chapter_key = chapter_display_name(chapter_number)
+# Proof-policy templates for generated week tasks; section rows add their section_id.
+_READ_PROOF_POLICY = {"type": "reading_time", "min_seconds": 120}
+_SECTION_TEST_PROOF_POLICY = {"type": "section_test", "threshold": COMPLETION_THRESHOLD}
+_CHAPTER_TEST_PROOF_POLICY = {"type": "test_score", "threshold": COMPLETION_THRESHOLD, "chapter_level": True}
+
+
+def _week_task_rows_for_chapter(*, learner_id: UUID, week_number: int, chapter_number: int) -> list[dict]:
+    """Task insert rows for a chapter week: read + test per subtopic, then the chapter test."""
     chapter_info = _chapter_info(chapter_number)
-    subtopics = chapter_info.get("subtopics", [])
-    tasks: list[Task] = []
-    sort = 0
-    for subtopic in subtopics:
-        sort += 1
-        tasks.append(
-            Task(
-                learner_id=learner_id,
-                week_number=week_number,
-                chapter=chapter_key,
-                task_type="read",
-                title=f"Read: {subtopic['id']} {subtopic['title']}",
-                sort_order=sort,
-                status="pending",
-                is_locked=False,
-                proof_policy={"type": "reading_time", "min_seconds": 120, "section_id": subtopic["id"]},
-            )
-        )
-        sort += 1
-        tasks.append(
-            Task(
-                learner_id=learner_id,
-                week_number=week_number,
-                chapter=chapter_key,
-                task_type="test",
-                title=f"Test: {subtopic['id']} {subtopic['title']}",
-                sort_order=sort,
-                status="pending",
-                is_locked=False,
-                proof_policy={"type": "section_test", "threshold": COMPLETION_THRESHOLD, "section_id": subtopic["id"]},
-            )
-        )
-    sort += 1
-    tasks.append(
-        Task(
-            learner_id=learner_id,
-            week_number=week_number,
-            chapter=chapter_key,
-            task_type="test",
-            title=f"Chapter Test: {chapter_info['title']}",
-            sort_order=sort,
-            status="pending",
-            is_locked=False,
-            proof_policy={"type": "test_score", "threshold": COMPLETION_THRESHOLD, "chapter_level": True},
+    common = {
+        "learner_id": learner_id,
+        "week_number": week_number,
+        "chapter": chapter_display_name(chapter_number),
+        "status": "pending",
+        "is_locked": False,
+    }
+    rows = [
+        row
+        for idx, st in enumerate(chapter_info.get("subtopics", []))
+        for row in (
+            {
+                **common,
+                "task_type": "read",
+                "title": f"Read: {st['id']} {st['title']}",
+                "sort_order": 2 * idx + 1,
+                "proof_policy": {**_READ_PROOF_POLICY, "section_id": st["id"]},
+            },
+            {
+                **common,
+                "task_type": "test",
+                "title": f"Test: {st['id']} {st['title']}",
+                "sort_order": 2 * idx + 2,
+                "proof_policy": {**_SECTION_TEST_PROOF_POLICY, "section_id": st["id"]},
+            },
         )
-    )
-    return tasks
+    ]
+    rows.append({
+        **common,
+        "task_type": "test",
+        "title": f"Chapter Test: {chapter_info['title']}",
+        "sort_order": len(rows) + 1,
+        "proof_policy": dict(_CHAPTER_TEST_PROOF_POLICY),
+    })
+    return rows
 
 
 async def _apply_dynamic_reading_requirement(
@@ -626,7 +628,7 @@ def _sanitize_question_payload(question: dict) -> dict:
 
 
 def _is_near_duplicate(candidate: str, existing: list[str], threshold: float = 0.9) -> bool:
-    return any(SequenceMatcher(a=candidate, b=prev).ratio() >= threshold for prev in existing)
+    return is_near_duplicate(candidate, existing, threshold)
 
 
 _QUESTION_STOPWORDS = {
@@ -672,7 +674,8 @@ def _dedupe_generated_questions(
 ) -> tuple[list[dict], int]:
     """Drop exact/normalized/near-duplicate question stems from LLM output."""
     out: list[dict] = []
-    seen_norm: list[str] = []
+    seen_norm: set[str] = set()
+    seen_norm_list: list[str] = []
     duplicates_removed = 0
     for item in raw_items:
         if not isinstance(item, dict):
@@ -690,10 +693,14 @@ def _dedupe_generated_questions(
         if not norm:
             duplicates_removed += 1
             continue
-        if norm in seen_norm or _is_near_duplicate(norm, seen_norm):
+        if norm in seen_norm:
             duplicates_removed += 1
             continue
-        seen_norm.append(norm)
+        if _is_near_duplicate(norm, seen_norm_list):
+            duplicates_removed += 1
+            continue
+        seen_norm.add(norm)
+        seen_norm_list.append(norm)
         out.append(item)
         if len(out) >= target_count:
             break
@@ -1205,12 +1212,9 @@ async def generate_chapter_test(payload: ContentRequest, db: AsyncSession = Depe
                 llm_text, _ = await _generate_text_with_mcp(candidate_prompt, role="content_generator")
                 if not llm_text:
                     continue
-                text = llm_text.strip()
-                start = text.find("[")
-                end = text.rfind("]") + 1
-                if start < 0 or end <= start:
+                parsed = extract_json_array(llm_text)
+                if parsed is None:
                     continue
-                parsed = json.loads(text[start:end])
                 formatted_parsed: list[dict] = []
                 for item in parsed:
                     if isinstance(item, dict):
@@ -1268,13 +1272,15 @@ async def generate_chapter_test(payload: ContentRequest, db: AsyncSession = Depe
         "[Q{n}] Which method should be applied first in a '{topic}' problem?",
         "[Q{n}] Identify the incorrect claim about '{topic}'.",
     ]
+    normalized_existing = [_normalized_question_text(q.prompt) for q in questions]
     while len(questions) < 10:
         i = len(questions)
         qid = f"t_{test_id}_q{i+1}"
         topic = subtopics[i % len(subtopics)] if subtopics else chapter_name
         prompt_text = fallback_templates[i % len(fallback_templates)].format(n=i + 1, topic=topic)
-        if _is_near_duplicate(_normalized_question_text(prompt_text), [_normalized_question_text(q.prompt) for q in questions]):
+        if _is_near_duplicate(_normalized_question_text(prompt_text), normalized_existing):
             prompt_text = f"[Q{i+1}] Apply a core concept from '{topic}' to select the correct option."
+        normalized_existing.append(_normalized_question_text(prompt_text))
         questions.append(TestQuestion(
             question_id=qid,
             prompt=prompt_text,
@@ -1662,7 +1668,9 @@ async def submit_chapter_test(payload: SubmitTestRequest, db: AsyncSession = Dep
     await db.commit()
 
     try:
-        await redis_client.delete(f"learning:dashboard:{payload.learner_id}")
+        await redis_client.delete(
+            f"learning:dashboard:{payload.learner_id}", f"learning:engagement:{payload.learner_id}"
+        )
     except Exception:
         pass
 
@@ -1964,7 +1972,9 @@ async def complete_reading(payload: CompleteReadingRequest, db: AsyncSession = D
     await db.commit()
 
     try:
-        await redis_client.delete(f"learning:dashboard:{payload.learner_id}")
+        await redis_client.delete(
+            f"learning:dashboard:{payload.learner_id}", f"learning:engagement:{payload.learner_id}"
+        )
     except Exception:
         pass
     return CompleteReadingResponse(task_id=str(task.id), accepted=True, reason="Reading completed! âœ…")
@@ -2521,12 +2531,9 @@ async def generate_section_test(payload: SubsectionContentRequest, db: AsyncSess
                 llm_text, _ = await _generate_text_with_mcp(candidate_prompt, role="content_generator")
                 if not llm_text:
                     continue
-                text = llm_text.strip()
-                start = text.find("[")
-                end = text.rfind("]") + 1
-                if start < 0 or end <= start:
+                parsed = extract_json_array(llm_text)
+                if parsed is None:
                     continue
-                parsed = json.loads(text[start:end])
                 formatted_parsed: list[dict] = []
                 for item in parsed:
                     if isinstance(item, dict):
@@ -2584,12 +2591,14 @@ async def generate_section_test(payload: SubsectionContentRequest, db: AsyncSess
         "[Q{n}] Which step is logically valid in a '{topic}' problem?",
         "[Q{n}] Identify the misconception related to '{topic}'.",
     ]
+    normalized_existing = [_normalized_question_text(q.prompt) for q in questions]
     while len(questions) < 5:
         i = len(questions)
         qid = f"st_{test_id}_q{i+1}"
         prompt_text = section_fallback_templates[i % len(section_fallback_templates)].format(n=i + 1, topic=section_title)
-        if _is_near_duplicate(_normalized_question_text(prompt_text), [_normalized_question_text(q.prompt) for q in questions]):
+        if _is_near_duplicate(_normalized_question_text(prompt_text), normalized_existing):
             prompt_text = f"[Q{i+1}] Select the most accurate application of '{section_title}'."
+        normalized_existing.append(_normalized_question_text(prompt_text))
         questions.append(TestQuestion(
             question_id=qid,
             prompt=prompt_text,
@@ -2779,13 +2788,12 @@ async def advance_week(learner_id: UUID, db: AsyncSession = Depends(get_db)):
             )
         ).scalars().all()
         if not existing_tasks:
-            new_tasks = list(_build_week_tasks_for_chapter(
+            # One multi-row INSERT for the whole week instead of per-task ORM adds.
+            await db.execute(insert(Task), _week_task_rows_for_chapter(
                 learner_id=learner_id,
                 week_number=new_week,
                 chapter_number=next_chapter_number,
             ))
-            if new_tasks:
-                db.add_all(new_tasks)
 
     profile.current_forecast_weeks = int(plan.total_weeks)
     profile.timeline_delta_weeks = int(plan.total_weeks - selected)
@@ -2819,28 +2827,25 @@ async def advance_week(learner_id: UUID, db: AsyncSession = Depends(get_db)):
         f"Week {current_week} complete; moved to week {new_week}. "
         f"Forecast is {plan.total_weeks} weeks vs selected {selected}."
     )
-    try:
-        await log_agent_decision(
-            db=db,
-            learner_id=learner_id,
-            agent_name="planner",
-            decision_type="pace_adjustment",
-            chapter=chapter_display_name(next_chapter_number) if next_chapter_number else None,
-            input_snapshot={
-                "current_week": current_week,
-                "new_week": new_week,
-                "selected_timeline_weeks": selected,
-            },
-            output_payload={
-                "total_weeks": int(plan.total_weeks),
-                "timeline_delta_weeks": int(plan.total_weeks - selected),
-                "pacing_status": pacing_status,
-            },
-            reasoning=pace_reasoning,
-        )
-        await db.commit()
-    except Exception:
-        pass
+    # Observability + cache invalidation are off the response's critical path.
+    run_detached(log_agent_decision_detached(
+        learner_id=learner_id,
+        agent_name="planner",
+        decision_type="pace_adjustment",
+        chapter=chapter_display_name(next_chapter_number) if next_chapter_number else None,
+        input_snapshot={
+            "current_week": current_week,
+            "new_week": new_week,
+            "selected_timeline_weeks": selected,
+        },
+        output_payload={
+            "total_weeks": int(plan.total_weeks),
+            "timeline_delta_weeks": int(plan.total_weeks - selected),
+            "pacing_status": pacing_status,
+        },
+        reasoning=pace_reasoning,
+    ))
+    run_detached(delete_cache_key_quietly(f"learning:dashboard:{learner_id}", f"learning:engagement:{learner_id}"))
 
     message = f"Week {current_week} complete! "
     if next_chapter_number:
@@ -2848,11 +2853,6 @@ async def advance_week(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     else:
         message += "You've completed all chapters!"
 
-    try:
-        await redis_client.delete(f"learning:dashboard:{learner_id}")
-    except Exception:
-        pass
-
     return WeekCompleteResponse(
         learner_id=str(learner_id),
         completed_week=current_week,
@@ -2867,6 +2867,22 @@ async def advance_week(learner_id: UUID, db: AsyncSession = Depends(get_db)):
 # 6. Dashboard
 DASHBOARD_CACHE_TTL = 60  # seconds
 
+# Week status labels used in the dashboard's rough plan.
+_WEEK_COMPLETED = "completed"
+_WEEK_CURRENT = "current"
+_WEEK_UPCOMING = "upcoming"
+
+# Static per-chapter fields (number, key, title, subtopics), built once from the syllabus.
+_DASHBOARD_CHAPTERS = tuple(
+    (
+        ch["number"],
+        chapter_display_name(ch["number"]),
+        ch["title"],
+        [{"id": s["id"], "title": s["title"]} for s in ch.get("subtopics", [])],
+    )
+    for ch in SYLLABUS_CHAPTERS
+)
+
 @router.get("/dashboard/{learner_id}", response_model=DashboardResponse)
 async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     """Return complete dashboard data: plan, completion, confidence, tasks. Cached 60s in Redis."""
@@ -2874,8 +2890,8 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     try:
         cached = await redis_client.get(cache_key)
         if cached:
-            data = json.loads(cached)
-            return DashboardResponse(**data)
+            # Stored body was produced by DashboardResponse below; serve it verbatim.
+            return Response(content=cached, media_type="application/json")
     except Exception:
         pass
 
@@ -2884,15 +2900,21 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
 
     # Get student name
     from app.models.entities import StudentAuth
-    auth = (await db.execute(
-        select(StudentAuth).where(StudentAuth.learner_id == learner_id)
+    auth_name = (await db.execute(
+        select(StudentAuth.name).where(StudentAuth.learner_id == learner_id)
     )).scalar_one_or_none()
-    student_name = auth.name if auth else "Student"
+    student_name = auth_name if auth_name else "Student"
 
-    # Chapter progressions
+    # Chapter progressions (read-only: fetch just the columns rendered below)
     progressions = (await db.execute(
-        select(ChapterProgression).where(ChapterProgression.learner_id == learner_id)
-    )).scalars().all()
+        select(
+            ChapterProgression.chapter,
+            ChapterProgression.status,
+            ChapterProgression.best_score,
+            ChapterProgression.attempt_count,
+            ChapterProgression.revision_queued,
+        ).where(ChapterProgression.learner_id == learner_id)
+    )).all()
     prog_map = {p.chapter: p for p in progressions}
 
     # Build chapter status and confidence lists
@@ -2900,9 +2922,9 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     chapter_confidence = []
     completed_count = 0
     mastery_sum = 0.0
+    mastery = profile.concept_mastery or {}
 
-    for ch in SYLLABUS_CHAPTERS:
-        ch_key = chapter_display_name(ch["number"])
+    for ch_number, ch_key, ch_title, subtopics in _DASHBOARD_CHAPTERS:
         cp = prog_map.get(ch_key)
         status = cp.status if cp else "not_started"
         best_score = cp.best_score if cp else 0.0
@@ -2912,23 +2934,21 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
         if status == "completed":
             completed_count += 1
 
-        mastery_score = (profile.concept_mastery or {}).get(ch_key, 0.0)
+        mastery_score = mastery.get(ch_key, 0.0)
         mastery_sum += mastery_score
 
-        subtopics = [{"id": s["id"], "title": s["title"]} for s in ch.get("subtopics", [])]
-
         chapter_status.append({
-            "chapter_number": ch["number"],
+            "chapter_number": ch_number,
             "chapter_key": ch_key,
-            "title": ch["title"],
+            "title": ch_title,
             "status": status,
             "subtopics": subtopics,
         })
 
         chapter_confidence.append({
-            "chapter_number": ch["number"],
+            "chapter_number": ch_number,
             "chapter_key": ch_key,
-            "title": ch["title"],
+            "title": ch_title,
             "best_score": round(best_score, 2),
             "mastery_score": round(mastery_score, 2),
             "mastery_band": _mastery_band(mastery_score),
@@ -2961,7 +2981,7 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
                     "week_start_date": None,
                     "week_end_date": None,
                     "week_label": f"Week {w}",
-                    "status": "completed",
+                    "status": _WEEK_COMPLETED,
                 })
                 continue
             week_start, week_end = week_bounds_from_plan(onboarding_date, w, week_start_overrides)
@@ -2973,7 +2993,7 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
                 "week_start_date": week_start.isoformat(),
                 "week_end_date": week_end.isoformat(),
                 "week_label": week_label,
-                "status": "completed" if w < cw else ("current" if w == cw else "upcoming"),
+                "status": _WEEK_COMPLETED if w < cw else (_WEEK_CURRENT if w == cw else _WEEK_UPCOMING),
             })
             timeline_visualization.append(
                 {
@@ -2998,11 +3018,20 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
         total_weeks_forecast=(profile.current_forecast_weeks or (plan.total_weeks if plan else 14)),
     )
     tasks = (await db.execute(
-        select(Task).where(
+        select(
+            Task.id,
+            Task.chapter,
+            Task.task_type,
+            Task.title,
+            Task.status,
+            Task.is_locked,
+            Task.proof_policy,
+            Task.scheduled_day,
+        ).where(
             Task.learner_id == learner_id,
             Task.week_number == current_week,
         ).order_by(Task.sort_order)
-    )).scalars().all()
+    )).all()
 
     current_tasks = []
     for t in tasks:
@@ -3028,11 +3057,11 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
 
     # Revision queue
     revisions = (await db.execute(
-        select(RevisionQueueItem).where(
+        select(RevisionQueueItem.chapter, RevisionQueueItem.reason, RevisionQueueItem.priority).where(
             RevisionQueueItem.learner_id == learner_id,
             RevisionQueueItem.status == "pending",
         )
-    )).scalars().all()
+    )).all()
     revision_list = [{"chapter": r.chapter, "reason": r.reason, "priority": r.priority} for r in revisions]
 
     response = DashboardResponse(
@@ -3065,70 +3094,95 @@ async def get_dashboard(learner_id: UUID, db: AsyncSession = Depends(get_db)):
         current_week_tasks=current_tasks,
         revision_queue=revision_list,
     )
+    body = response.model_dump_json()
     try:
-        await redis_client.set(cache_key, response.model_dump_json(), ex=DASHBOARD_CACHE_TTL)
+        await redis_client.set(cache_key, body, ex=DASHBOARD_CACHE_TTL)
     except Exception:
         pass
-    return response
+    return Response(content=body, media_type="application/json")
 
 
 # 7. Plan history
-@router.get("/plan-history/{learner_id}")
-async def get_plan_history(learner_id: UUID, db: AsyncSession = Depends(get_db)):
-    """Return all plan versions for a learner, newest first."""
+@router.get("/plan-history/{learner_id}", response_class=ORJSONResponse)
+async def get_plan_history(
+    learner_id: UUID,
+    limit: int = Query(50, ge=1, le=500),
+    offset: int = Query(0, ge=0),
+    full: bool = Query(True, description="Include each version's plan_payload"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return a page of plan versions for a learner, newest first."""
+    columns = [
+        WeeklyPlanVersion.version_number,
+        WeeklyPlanVersion.current_week,
+        WeeklyPlanVersion.reason,
+        WeeklyPlanVersion.created_at,
+        # Counted before LIMIT/OFFSET, so each row carries the learner's full total.
+        func.count().over().label("total_versions"),
+    ]
+    if full:
+        columns.append(WeeklyPlanVersion.plan_payload)
     versions = (await db.execute(
-        select(WeeklyPlanVersion).where(
+        select(*columns).where(
             WeeklyPlanVersion.learner_id == learner_id
-        ).order_by(desc(WeeklyPlanVersion.created_at))
-    )).scalars().all()
-
-    return {
+        ).order_by(desc(WeeklyPlanVersion.created_at)).limit(limit).offset(offset)
+    )).all()
+    if versions:
+        total_versions = versions[0].total_versions
+    elif offset:
+        # Paged past the end: no row to carry the window count.
+        total_versions = (await db.execute(
+            select(func.count()).select_from(WeeklyPlanVersion).where(WeeklyPlanVersion.learner_id == learner_id)
+        )).scalar_one()
+    else:
+        total_versions = 0
+
+    items = []
+    for v in versions:
+        item = {
+            "version_number": v.version_number,
+            "current_week": v.current_week,
+            "reason": v.reason,
+            "created_at": v.created_at,
+        }
+        if full:
+            item["plan_payload"] = v.plan_payload
+        items.append(item)
+    return ORJSONResponse({
         "learner_id": str(learner_id),
-        "total_versions": len(versions),
-        "versions": [
-            {
-                "version_number": v.version_number,
-                "current_week": v.current_week,
-                "reason": v.reason,
-                "plan_payload": v.plan_payload,
-                "created_at": v.created_at.isoformat() if v.created_at else None,
-            }
-            for v in versions
-        ],
-    }
+        "total_versions": total_versions,
+        "limit": limit,
+        "offset": offset,
+        "versions": items,
+    })
 
-@router.get("/confidence-trend/{learner_id}")
+@router.get("/confidence-trend/{learner_id}", response_class=ORJSONResponse)
 async def get_confidence_trend(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     """Return recent assessment trend for charting confidence over time."""
     rows = (await db.execute(
-        select(AssessmentResult).where(
+        select(AssessmentResult.timestamp, AssessmentResult.score, AssessmentResult.concept).where(
             AssessmentResult.learner_id == learner_id
         ).order_by(AssessmentResult.timestamp.asc()).limit(200)
-    )).scalars().all()
+    )).all()
+    if not rows:
+        return ORJSONResponse({"learner_id": str(learner_id), "points": [], "trend": "flat", "latest_score": 0.0})
     points = [
-        {
-            "timestamp": r.timestamp.isoformat() if r.timestamp else None,
-            "score": round(float(r.score or 0.0), 4),
-            "concept": r.concept,
-        }
-        for r in rows
+        {"timestamp": ts, "score": round(float(score or 0.0), 4), "concept": concept}
+        for ts, score, concept in rows
     ]
-    if not points:
-        return {"learner_id": str(learner_id), "points": [], "trend": "flat", "latest_score": 0.0}
     latest = points[-1]["score"]
-    window = points[-5:]
-    avg = sum(p["score"] for p in window) / max(1, len(window))
+    avg = fmean(p["score"] for p in points[-5:])
     trend = "up" if latest > avg + 0.02 else ("down" if latest < avg - 0.02 else "flat")
-    return {
+    return ORJSONResponse({
         "learner_id": str(learner_id),
         "points": points,
         "trend": trend,
         "latest_score": round(latest, 4),
-    }
+    })
 
 
 # 8. Agent decision history
-@router.get("/decisions/{learner_id}")
+@router.get("/decisions/{learner_id}", response_class=ORJSONResponse)
 async def get_agent_decisions(learner_id: UUID, limit: int = 50, db: AsyncSession = Depends(get_db)):
     """Return recent agent decisions for observability."""
     decisions = (await db.execute(
@@ -3137,12 +3191,12 @@ async def get_agent_decisions(learner_id: UUID, limit: int = 50, db: AsyncSessio
         ).order_by(desc(AgentDecision.created_at)).limit(limit)
     )).scalars().all()
 
-    return {
+    return ORJSONResponse({
         "learner_id": str(learner_id),
         "total": len(decisions),
         "decisions": [
             {
-                "id": str(d.id),
+                "id": d.id,
                 "agent_name": d.agent_name,
                 "decision_type": d.decision_type,
                 "chapter": d.chapter,
@@ -3151,10 +3205,10 @@ async def get_agent_decisions(learner_id: UUID, limit: int = 50, db: AsyncSessio
                 "reasoning": d.reasoning,
                 "input_snapshot": d.input_snapshot,
                 "output_payload": d.output_payload,
-                "created_at": d.created_at.isoformat() if d.created_at else None,
+                "created_at": d.created_at,
             }
             for d in decisions
         ],
-    }
+    })
 
 
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import time
+
 from fastapi import APIRouter
 
 from app.core.app_metrics import get_metrics
@@ -10,14 +12,30 @@ from app.core.mcp_metrics import get_mcp_metrics
 from app.core.metrics_base import all_snapshots
 from app.core.retrieval_metrics import get_retrieval_metrics
 from app.core.resilience import get_breakers_status
+from app.core.responses import ORJSONResponse
 from app.telemetry.aggregator import fleet_telemetry_aggregator
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
+# Reuse the last /metrics/app snapshot briefly: well under a typical 15 s scrape interval.
+APP_METRICS_SNAPSHOT_TTL = 2.0  # seconds
+_METRICS_CACHE_HEADERS = {"Cache-Control": f"max-age={int(APP_METRICS_SNAPSHOT_TTL)}"}
+_app_metrics_snapshot: dict = {"value": None, "expires_at": 0.0}
+
 
-@router.get("/app")
+@router.get("/app", response_class=ORJSONResponse)
 async def app_metrics():
     """Request latency (p50/p95), error rate, agent/fleet metrics, and anomaly alerts."""
+    now = time.monotonic()
+    if _app_metrics_snapshot["value"] is not None and now < _app_metrics_snapshot["expires_at"]:
+        return ORJSONResponse(_app_metrics_snapshot["value"], headers=_METRICS_CACHE_HEADERS)
+    out = _collect_app_metrics()
+    _app_metrics_snapshot["value"] = out
+    _app_metrics_snapshot["expires_at"] = now + APP_METRICS_SNAPSHOT_TTL
+    return ORJSONResponse(out, headers=_METRICS_CACHE_HEADERS)
+
+
+def _collect_app_metrics() -> dict:
     out = get_metrics()
     try:
         fleet = fleet_telemetry_aggregator.aggregate()
@@ -63,14 +81,14 @@ async def app_metrics():
     return out
 
 
-@router.get("/fleet")
+@router.get("/fleet", response_class=ORJSONResponse)
 async def fleet_metrics():
-    return fleet_telemetry_aggregator.aggregate()
+    return ORJSONResponse(fleet_telemetry_aggregator.aggregate(), headers=_METRICS_CACHE_HEADERS)
 
 
-@router.get("/resilience")
+@router.get("/resilience", response_class=ORJSONResponse)
 async def resilience_metrics():
-    return {"breakers": get_breakers_status()}
+    return ORJSONResponse({"breakers": get_breakers_status()}, headers=_METRICS_CACHE_HEADERS)
 
 
 @router.get("/prometheus")
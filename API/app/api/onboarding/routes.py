@@ -1,16 +1,28 @@
 from __future__ import annotations
 
-import json
 import logging
 import re
-from datetime import date, datetime, timedelta, timezone
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from itertools import cycle
+from statistics import fmean
+from types import MappingProxyType
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import desc, select
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import and_, desc, func, insert, literal_column, select, true
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.jwt_auth import create_token
+from app.core.responses import ORJSONResponse
 from app.core.logging import DOMAIN_ONBOARDING, get_domain_logger
 from app.core.settings import settings
 from app.core.timeline import (
@@ -30,7 +42,6 @@ from app.mcp.client import execute_mcp
 from app.mcp.contracts import MCPRequest
 from app.models.entities import (
     ChapterProgression,
-    EmbeddingChunk,
     EngagementEvent,
     Learner,
     LearnerProfile,
@@ -60,7 +71,6 @@ from app.schemas.onboarding import (
     RevisionPolicyStateResponse,
     OnboardingStartRequest,
     OnboardingStartResponse,
-    RevisionQueueItemResponse,
     TaskCompletionRequest,
     TaskCompletionResponse,
     TaskItem,
@@ -85,48 +95,71 @@ router = APIRouter(prefix="/onboarding", tags=["onboarding"])
 logger = get_domain_logger(__name__, DOMAIN_ONBOARDING)
 TIMELINE_MIN_WEEKS = 14
 TIMELINE_MAX_WEEKS = 28
+# Syllabus-derived lookups computed once at import.
+_SYLLABUS_BY_NUMBER: dict[int, dict] = {int(ch["number"]): ch for ch in SYLLABUS_CHAPTERS}
+_CHAPTER_KEYS: tuple[str, ...] = tuple(chapter_display_name(ch["number"]) for ch in SYLLABUS_CHAPTERS)
+# All chapters start at 0.0 — diagnostic score is used only for cognitive_depth
+# and plan pacing, NOT for chapter mastery.
+_INITIAL_MASTERY: dict[str, float] = dict.fromkeys(_CHAPTER_KEYS, 0.0)
+# Rolling windows evaluated by Postgres against its own clock (no app-side bind values).
+_LAST_DAY_START = func.now() - literal_column("INTERVAL '1 day'")
+_LAST_WEEK_START = func.now() - literal_column("INTERVAL '7 days'")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"[A-Za-z0-9]+")
+# Lower bounds of each mastery band above "Beginner"; bisect maps a score to its band index.
+_MASTERY_BAND_THRESHOLDS = (0.45, 0.70, 0.85)
+_MASTERY_BANDS = ("Beginner", "Developing", "Proficient", "Mastered")
+_WEAK_MASTERY_THRESHOLD = _MASTERY_BAND_THRESHOLDS[0]
+# Read-only stand-in for a missing concept_mastery, so readers never copy the map.
+_EMPTY_MASTERY: Mapping[str, float] = MappingProxyType({})
 
 # ── Shared helpers (canonical implementations in services/shared_helpers.py) ──
 from app.services.shared_helpers import (  # noqa: E402
     get_idempotent_response as _get_idempotent_response,
     set_idempotent_response as _set_idempotent_response,
     upsert_revision_queue_item as _upsert_revision_queue_item_shared,
-    compute_login_streak_days as _compute_login_streak_days,
+    login_streak_days_subquery as _login_streak_days_subquery,
     log_engagement_event as _log_engagement_event,
+    log_agent_decision_detached,
+    run_detached,
+)
+from app.services.diagnostic_chunks import (  # noqa: E402
+    DiagnosticChunk as _DiagnosticChunk,
+    get_diagnostic_chunks as _get_diagnostic_chunks,
 )
 
 
 def _extract_sentence(text: str) -> str:
-    parts = re.split(r"(?<=[.!?])\s+", (text or "").strip())
+    parts = _SENTENCE_SPLIT_RE.split((text or "").strip())
     return (parts[0] if parts else "").strip() or "Review the core chapter concept."
 
 
 def _extract_keywords(text: str, limit: int = 5) -> list[str]:
-    words = re.findall(r"[A-Za-z0-9]+", (text or "").lower())
-    seen: list[str] = []
+    words = _WORD_RE.findall((text or "").lower())
+    keywords: list[str] = []
+    seen: set[str] = set()
     for word in words:
-        if len(word) < 4:
-            continue
-        if word in seen:
+        if len(word) < 4 or word in seen:
             continue
-        seen.append(word)
-        if len(seen) >= limit:
+        seen.add(word)
+        keywords.append(word)
+        if len(keywords) >= limit:
             break
-    return seen or ["concept", "chapter"]
-
+    return keywords or ["concept", "chapter"]
 
 
-
-
-def _build_questions(chunks: list[EmbeddingChunk]) -> tuple[list[DiagnosticQuestion], dict[str, str]]:
+def _build_questions(chunks: list[_DiagnosticChunk]) -> tuple[list[DiagnosticQuestion], dict[str, str]]:
     questions: list[DiagnosticQuestion] = []
     answer_key: dict[str, str] = {}
     chapter_pool = sorted({c.chapter_number for c in chunks if c.chapter_number is not None}) or [1, 2, 3]
+    distractors_by_chapter: dict[int, list[str]] = {
+        ch: [str(x) for x in chapter_pool if x != ch][:3] for ch in {*chapter_pool, 1}
+    }
+    # Each chunk is split and tokenized exactly once up front.
+    sentences = [(_extract_sentence(chunk.content), chunk.chapter_number or 1) for chunk in chunks[:9]]
+    features = [(sentence, _extract_keywords(sentence, limit=3), ch) for sentence, ch in sentences]
 
-    for idx, chunk in enumerate(chunks[:9]):
-        sentence = _extract_sentence(chunk.content)
-        chapter_number = chunk.chapter_number or 1
-
+    for idx, (sentence, keywords, chapter_number) in enumerate(features):
         # Q1: True/False grounded directly in retrieved chunk sentence.
         tf_id = f"q_tf_{idx}"
         questions.append(
@@ -141,9 +174,9 @@ def _build_questions(chunks: list[EmbeddingChunk]) -> tuple[list[DiagnosticQuest
         answer_key[tf_id] = "true"
 
         # Q2: Fill in the blank using a keyword from the chunk.
-        keywords = _extract_keywords(sentence, limit=3)
         blank_word = keywords[-1]
-        blank_prompt = re.sub(rf"\b{re.escape(blank_word)}\b", "_____", sentence, count=1, flags=re.IGNORECASE)
+        blank_re = re.compile(rf"\b{re.escape(blank_word)}\b", re.IGNORECASE)
+        blank_prompt = blank_re.sub("_____", sentence, count=1)
         fb_id = f"q_fb_{idx}"
         questions.append(
             DiagnosticQuestion(
@@ -157,9 +190,7 @@ def _build_questions(chunks: list[EmbeddingChunk]) -> tuple[list[DiagnosticQuest
         answer_key[fb_id] = blank_word.lower()
 
         # Q3: MCQ for chapter linkage.
-        distractors = [str(ch) for ch in chapter_pool if ch != chapter_number][:3]
-        options = [str(chapter_number), *distractors]
-        options = options[:4]
+        options = [str(chapter_number), *distractors_by_chapter[chapter_number]]
         mcq_id = f"q_mcq_{idx}"
         questions.append(
             DiagnosticQuestion(
@@ -175,20 +206,13 @@ def _build_questions(chunks: list[EmbeddingChunk]) -> tuple[list[DiagnosticQuest
     return questions, answer_key
 
 
-async def _get_diagnostic_chunks(db: AsyncSession) -> list[EmbeddingChunk]:
-    rows = (
-        await db.execute(
-            select(EmbeddingChunk)
-            .where(EmbeddingChunk.doc_type == "chapter")
-            .order_by(EmbeddingChunk.chapter_number.asc(), EmbeddingChunk.chunk_index.asc())
-            .limit(9)
-        )
-    ).scalars()
-    return list(rows)
-
-
 def _clamp_weeks(weeks: int) -> int:
-    return max(TIMELINE_MIN_WEEKS, min(TIMELINE_MAX_WEEKS, int(weeks)))
+    # Callers pass ints (pydantic-validated or int()-coerced at the boundary).
+    if weeks < TIMELINE_MIN_WEEKS:
+        return TIMELINE_MIN_WEEKS
+    if weeks > TIMELINE_MAX_WEEKS:
+        return TIMELINE_MAX_WEEKS
+    return weeks
 
 
 def _recommend_timeline_weeks(selected_timeline_weeks: int, score: float) -> tuple[int, str]:
@@ -304,16 +328,16 @@ async def _compute_retention_score(db: AsyncSession, learner_id: UUID) -> float:
     except Exception:
         pass
     recent = (
-        await db.execute(
-            select(AssessmentResult.score)
-            .where(AssessmentResult.learner_id == learner_id)
-            .order_by(desc(AssessmentResult.timestamp))
-            .limit(20)
-        )
-    ).scalars().all()
-    if not recent:
+        select(AssessmentResult.score)
+        .where(AssessmentResult.learner_id == learner_id)
+        .order_by(desc(AssessmentResult.timestamp))
+        .limit(20)
+        .subquery()
+    )
+    avg = (await db.execute(select(func.avg(recent.c.score)))).scalar_one()
+    if avg is None:
         return 0.5
-    score = max(0.0, min(1.0, float(sum(recent) / len(recent))))
+    score = max(0.0, min(1.0, float(avg)))
     try:
         from app.memory.cache import redis_client
         await redis_client.set(cache_key, str(round(score, 6)), ex=300)
@@ -322,6 +346,21 @@ async def _compute_retention_score(db: AsyncSession, learner_id: UUID) -> float:
     return score
 
 
+def _confidence_score(profile: LearnerProfile | Row, retention: float, adherence: float) -> float:
+    """Blend cognitive depth, engagement, retention and weekly adherence into a 0-1 score.
+
+    Computed per read rather than stored: retention and adherence move with new
+    assessments and the rolling week, so a persisted value would go stale.
+    """
+    raw = (
+        (0.45 * float(profile.cognitive_depth or 0.0))
+        + (0.25 * float(profile.engagement_score or 0.0))
+        + (0.20 * retention)
+        + (0.10 * adherence)
+    )
+    return round(max(0.0, min(1.0, raw)), 3)
+
+
 def _profile_snapshot_payload(profile: LearnerProfile) -> dict:
     return {
         "concept_mastery": dict(profile.concept_mastery or {}),
@@ -362,32 +401,124 @@ def _persist_profile_snapshot(
 
 
 
-async def _compute_adherence_rate_week(db: AsyncSession, learner_id: UUID) -> float:
-    week_start = datetime.now(timezone.utc) - timedelta(days=7)
-    tasks = (
+async def _engagement_and_adherence_week(db: AsyncSession, learner_id: UUID) -> tuple[int, float]:
+    """Return (7-day engagement minutes, 7-day task adherence) in one round-trip.
+
+    The request's ``AsyncSession`` cannot run two statements concurrently, so the
+    two independent reads are combined (minutes as a scalar subquery next to the
+    task counts) instead of gathered.
+    """
+    minutes_q = (
+        select(func.coalesce(func.sum(EngagementEvent.duration_minutes), 0))
+        .where(EngagementEvent.learner_id == learner_id, EngagementEvent.created_at >= _LAST_WEEK_START)
+        .scalar_subquery()
+    )
+    minutes, completed, total = (
         await db.execute(
-            select(Task).where(
+            select(minutes_q, func.count().filter(Task.status == "completed"), func.count()).where(
                 Task.learner_id == learner_id,
-                Task.created_at >= week_start,
+                Task.created_at >= _LAST_WEEK_START,
             )
         )
-    ).scalars().all()
-    if not tasks:
-        return 0.0
-    completed = len([t for t in tasks if t.status == "completed"])
-    return round(float(completed / max(1, len(tasks))), 3)
+    ).one()
+    adherence = round(float(completed / total), 3) if total else 0.0
+    return int(minutes or 0), adherence
 
 
-async def _engagement_minutes_since(db: AsyncSession, learner_id: UUID, since: datetime) -> int:
-    rows = (
-        await db.execute(
-            select(EngagementEvent.duration_minutes).where(
-                EngagementEvent.learner_id == learner_id,
-                EngagementEvent.created_at >= since,
-            )
+@dataclass(frozen=True, slots=True)
+class _EngagementStats:
+    minutes_today: int
+    minutes_week: int
+    adherence_rate_week: float
+    login_streak_days: int
+    last_login_at: datetime | None
+    last_logout_at: datetime | None
+
+
+LEARNER_ENGAGEMENT_CACHE_TTL = 30  # seconds
+
+
+async def invalidate_learner_engagement_stats(learner_id: UUID) -> None:
+    # Task and engagement writes in app/api/learning/routes.py delete the same key.
+    try:
+        await redis_client.delete(f"learning:engagement:{learner_id}")
+    except Exception:
+        pass
+
+
+async def _learner_engagement_stats(db: AsyncSession, learner_id: UUID) -> _EngagementStats:
+    """Read every engagement-derived dashboard figure for a learner as one row.
+
+    Computed live rather than from a periodically refreshed materialized view: each
+    piece is an index range scan bounded by learner and window (7 days of events
+    and tasks, at most 60 login days), so a single statement stays cheap. Results
+    are cached in Redis per learner for ``LEARNER_ENGAGEMENT_CACHE_TTL`` seconds so
+    back-to-back dashboard renders share one read; every task/engagement write
+    deletes the key, so all workers see the change on their next read.
+    """
+    cache_key = f"learning:engagement:{learner_id}"
+    try:
+        cached = await redis_client.get(cache_key)
+        if cached:
+            data = orjson.loads(cached)
+            for field in ("last_login_at", "last_logout_at"):
+                if data[field] is not None:
+                    data[field] = datetime.fromisoformat(data[field])
+            return _EngagementStats(**data)
+    except Exception:
+        pass
+    engagement = (
+        select(
+            func.coalesce(
+                func.sum(EngagementEvent.duration_minutes).filter(EngagementEvent.created_at >= _LAST_DAY_START), 0
+            ).label("minutes_today"),
+            func.coalesce(func.sum(EngagementEvent.duration_minutes), 0).label("minutes_week"),
+        )
+        .where(EngagementEvent.learner_id == learner_id, EngagementEvent.created_at >= _LAST_WEEK_START)
+        .subquery()
+    )
+    week_tasks = (
+        select(
+            func.count().filter(Task.status == "completed").label("completed"),
+            func.count().label("total"),
         )
-    ).scalars().all()
-    return int(sum(int(v or 0) for v in rows))
+        .where(Task.learner_id == learner_id, Task.created_at >= _LAST_WEEK_START)
+        .subquery()
+    )
+    last_login, last_logout = (
+        select(EngagementEvent.created_at)
+        .where(EngagementEvent.learner_id == learner_id, EngagementEvent.event_type == event_type)
+        .order_by(EngagementEvent.created_at.desc())
+        .limit(1)
+        .scalar_subquery()
+        for event_type in ("login", "logout")
+    )
+    row = (
+        await db.execute(
+            select(
+                engagement.c.minutes_today,
+                engagement.c.minutes_week,
+                week_tasks.c.completed,
+                week_tasks.c.total,
+                _login_streak_days_subquery(learner_id).label("login_streak_days"),
+                last_login.label("last_login"),
+                last_logout.label("last_logout"),
+            ).select_from(engagement.join(week_tasks, true()))
+        )
+    ).one()
+    stats = _EngagementStats(
+        minutes_today=int(row.minutes_today),
+        minutes_week=int(row.minutes_week),
+        adherence_rate_week=round(float(row.completed / row.total), 3) if row.total else 0.0,
+        login_streak_days=int(row.login_streak_days or 0),
+        last_login_at=row.last_login,
+        last_logout_at=row.last_logout,
+    )
+    try:
+        await redis_client.set(cache_key, orjson.dumps(stats).decode(), ex=LEARNER_ENGAGEMENT_CACHE_TTL)
+    except Exception:
+        pass
+    return stats
 
 
 async def _update_profile_after_outcome(
@@ -404,15 +535,14 @@ async def _update_profile_after_outcome(
         merged = dict(profile.concept_mastery or {})
         merged.update(mastery_update)
         profile.concept_mastery = merged
-    week_start = datetime.now(timezone.utc) - timedelta(days=7)
-    minutes_week = await _engagement_minutes_since(db, learner_id, since=week_start)
-    adherence = await _compute_adherence_rate_week(db, learner_id)
+    minutes_week, adherence = await _engagement_and_adherence_week(db, learner_id)
     normalized_minutes = min(1.0, float(max(0, minutes_week + max(0, int(engagement_minutes))) / 300.0))
     profile.engagement_score = round(max(0.1, min(1.0, (0.7 * normalized_minutes) + (0.3 * adherence))), 3)
-    chapter_scores = [float(v) for k, v in (profile.concept_mastery or {}).items() if str(k).startswith("Chapter")]
+    # JSONB object keys are always str, so no str() wrap is needed on mastery keys.
+    chapter_scores = [float(v) for k, v in (profile.concept_mastery or {}).items() if k.startswith("Chapter")]
     if chapter_scores:
-        completed = len([v for v in chapter_scores if v >= 0.60])
-        profile.progress_percentage = round((completed / max(1, len(chapter_scores))) * 100.0, 2)
+        completed = sum(1 for v in chapter_scores if v >= 0.60)
+        profile.progress_percentage = round((completed / len(chapter_scores)) * 100.0, 2)
         if completed >= len(chapter_scores):
             profile.progress_status = "completed"
         elif completed > 0:
@@ -449,44 +579,69 @@ def _derive_recommendations(*, risk_level: str, misconception_patterns: list[dic
 
 
 async def _build_evaluation_analytics(db: AsyncSession, learner_id: UUID) -> dict:
-    results = (
+    # Aggregate the 30 most recent results in SQL; only a handful of scalars come back.
+    recent = (
+        select(
+            AssessmentResult.score,
+            AssessmentResult.response_time,
+            func.lower(AssessmentResult.error_type).label("error_type"),
+            AssessmentResult.timestamp,
+        )
+        .where(AssessmentResult.learner_id == learner_id)
+        .order_by(AssessmentResult.timestamp.desc())
+        .limit(30)
+        .cte("recent_results")
+    )
+    first_score_q = select(recent.c.score).order_by(recent.c.timestamp.asc()).limit(1).scalar_subquery()
+    latest_score_q = select(recent.c.score).order_by(recent.c.timestamp.desc()).limit(1).scalar_subquery()
+    attempted, avg_score, avg_response, first_score, latest_score = (
         await db.execute(
-            select(AssessmentResult)
-            .where(AssessmentResult.learner_id == learner_id)
-            .order_by(AssessmentResult.timestamp.desc())
-            .limit(30)
-        )
-    ).scalars().all()
-    scores = [float(r.score) for r in reversed(results)]
-    response_times = [float(r.response_time) for r in reversed(results)]
-    error_types = [str(r.error_type or "none").lower() for r in results]
-    avg_score = float(sum(scores) / max(1, len(scores)))
+            select(
+                func.count(),
+                func.avg(recent.c.score),
+                func.avg(recent.c.response_time),
+                first_score_q,
+                latest_score_q,
+            ).select_from(recent)
+        )
+    ).one()
+    avg_score = float(avg_score or 0.0)
+    avg_response = float(avg_response or 0.0)
     trend = "flat"
-    if len(scores) > 1:
-        trend = "up" if scores[-1] >= scores[0] else "down"
-    misconceptions: dict[str, int] = {}
-    for error in error_types:
-        if error == "none":
-            continue
-        misconceptions[error] = misconceptions.get(error, 0) + 1
+    if attempted > 1:
+        trend = "up" if latest_score >= first_score else "down"
+    misconception_rows = (
+        await db.execute(
+            select(recent.c.error_type, func.count())
+            # NULL fails the comparison already; "" was also treated as "none" before.
+            .where(recent.c.error_type != "none", recent.c.error_type != "")
+            .group_by(recent.c.error_type)
+            .order_by(func.count().desc(), func.max(recent.c.timestamp).desc())
+        )
+    ).all()
     misconception_patterns = [
-        {"error_type": key, "count": value}
-        for key, value in sorted(misconceptions.items(), key=lambda item: item[1], reverse=True)
+        {"error_type": error_type, "count": int(count)} for error_type, count in misconception_rows
     ]
     risk_level = "low"
-    avg_response = float(sum(response_times) / max(1, len(response_times))) if response_times else 0.0
     if avg_score < 0.5 or (trend == "down" and avg_score < 0.65):
         risk_level = "high"
     elif avg_score < 0.75 or avg_response > 20.0:
         risk_level = "medium"
     chapter_rows = (
         await db.execute(
-            select(ChapterProgression)
+            select(
+                ChapterProgression.chapter,
+                ChapterProgression.attempt_count,
+                ChapterProgression.best_score,
+                ChapterProgression.last_score,
+                ChapterProgression.status,
+                ChapterProgression.revision_queued,
+            )
             .where(ChapterProgression.learner_id == learner_id)
             .order_by(ChapterProgression.updated_at.desc())
             .limit(20)
         )
-    ).scalars().all()
+    ).all()
     chapter_attempt_summary = [
         {
             "chapter": row.chapter,
@@ -500,8 +655,8 @@ async def _build_evaluation_analytics(db: AsyncSession, learner_id: UUID) -> dic
     ]
     return {
         "objective_evaluation": {
-            "attempted_questions": len(scores),
-            "latest_score": round(scores[-1], 4) if scores else 0.0,
+            "attempted_questions": int(attempted),
+            "latest_score": round(float(latest_score), 4) if attempted else 0.0,
             "avg_score": round(avg_score, 4),
             "avg_response_time": round(avg_response, 4),
             "score_trend": trend,
@@ -535,14 +690,14 @@ async def _build_comparative_analytics(db: AsyncSession, learner_id: UUID) -> di
     ).all()
     cohort_scores: list[float] = []
     learner_score = 0.0
-    learner_mastery = dict(profile.concept_mastery or {})
+    learner_mastery = profile.concept_mastery or _EMPTY_MASTERY
     learner_topics = {k: float(v) for k, v in learner_mastery.items() if str(k).startswith("Chapter")}
     learner_score = (
         sum(learner_topics.values()) / max(1, len(learner_topics))
         if learner_topics else 0.0
     )
     for row in cohort_rows:
-        mastery = dict(row.concept_mastery or {})
+        mastery = row.concept_mastery or _EMPTY_MASTERY
         vals = [float(v) for k, v in mastery.items() if str(k).startswith("Chapter")]
         cohort_scores.append(sum(vals) / max(1, len(vals)) if vals else 0.0)
     cohort_size = len(cohort_scores)
@@ -638,32 +793,35 @@ async def _build_comparative_analytics(db: AsyncSession, learner_id: UUID) -> di
 
 
 async def _upsert_revision_policy_state(db: AsyncSession, learner_id: UUID) -> RevisionPolicyState:
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == learner_id))
-    ).scalar_one_or_none()
-    if profile is None:
+    # Profile, policy state and pending revision chapters in one round-trip.
+    pending_chapters_q = (
+        select(func.array_agg(RevisionQueueItem.chapter.distinct()))
+        .where(
+            RevisionQueueItem.learner_id == learner_id,
+            RevisionQueueItem.status == "pending",
+        )
+        .scalar_subquery()
+    )
+    row = (
+        await db.execute(
+            select(LearnerProfile, RevisionPolicyState, pending_chapters_q)
+            .outerjoin(RevisionPolicyState, RevisionPolicyState.learner_id == LearnerProfile.learner_id)
+            .where(LearnerProfile.learner_id == learner_id)
+        )
+    ).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Learner profile not found.")
+    profile, state, pending_raw = row
 
-    state = (
-        await db.execute(select(RevisionPolicyState).where(RevisionPolicyState.learner_id == learner_id))
-    ).scalar_one_or_none()
     if state is None:
         state = RevisionPolicyState(learner_id=learner_id)
         db.add(state)
         await db.flush()
 
-    mastery = dict(profile.concept_mastery or {})
-    covered_chapters = len([k for k, v in mastery.items() if str(k).startswith("Chapter") and float(v) > 0.0])
-    weak_zones = [k for k, v in mastery.items() if str(k).startswith("Chapter") and float(v) < 0.60]
-    pending_revision = (
-        await db.execute(
-            select(RevisionQueueItem).where(
-                RevisionQueueItem.learner_id == learner_id,
-                RevisionQueueItem.status == "pending",
-            )
-        )
-    ).scalars().all()
-    pending_chapters = sorted({item.chapter for item in pending_revision})
+    chapter_mastery = {k: float(v) for k, v in (profile.concept_mastery or {}).items() if k.startswith("Chapter")}
+    covered_chapters = sum(1 for v in chapter_mastery.values() if v > 0.0)
+    weak_zone_set = {k for k, v in chapter_mastery.items() if v < 0.60}
+    pending_chapters = set(pending_raw or ())
     retention_score = await _compute_retention_score(db, learner_id)
 
     now = datetime.now(timezone.utc)
@@ -694,7 +852,7 @@ async def _upsert_revision_policy_state(db: AsyncSession, learner_id: UUID) -> R
             "Run targeted revision cycles before final assessments.",
         ]
 
-    weak_zone_list = sorted(set(weak_zones + pending_chapters))
+    weak_zone_list = sorted(weak_zone_set | pending_chapters)
     state.active_pass = active_pass
     state.retention_score = retention_score
     state.weak_zones = {"chapters": weak_zone_list}
@@ -705,113 +863,133 @@ async def _upsert_revision_policy_state(db: AsyncSession, learner_id: UUID) -> R
     return state
 
 
-def _default_week_tasks(*, learner_id: UUID, chapter: str, week_number: int) -> list[Task]:
-    match = re.search(r"(\d+)", chapter or "")
+# Per-subtopic (task_type, title prefix, proof policy) templates; policies are
+# copied per task because ``Task.proof_policy`` is a mutable JSONB dict.
+_SECTION_TASK_TEMPLATES: tuple[tuple[str, str, dict], ...] = (
+    ("read", "Read", {"min_reading_minutes": 3}),
+    ("test", "Test", {"require_test_attempt_id": True}),
+)
+_CHAPTER_TEST_PROOF_POLICY = {"require_test_attempt_id": True, "chapter_level": True}
+_CHAPTER_NUMBER_RE = re.compile(r"(\d+)")
+
+
+def _default_week_task_rows(*, learner_id: UUID, chapter: str, week_number: int) -> list[dict]:
+    """Task insert rows for a chapter week: read + test per subtopic, then the chapter test."""
+    match = _CHAPTER_NUMBER_RE.search(chapter or "")
     chapter_number = int(match.group(1)) if match else 1
-    ch_info = next((c for c in SYLLABUS_CHAPTERS if int(c["number"]) == chapter_number), None)
+    ch_info = _SYLLABUS_BY_NUMBER.get(chapter_number)
     if not ch_info:
         ch_info = {"number": chapter_number, "title": chapter, "subtopics": []}
 
-    chapter_label = chapter_display_name(chapter_number)
-    tasks: list[Task] = []
-    sort = 0
-
-    for st in ch_info.get("subtopics", []):
-        section_id = st.get("id")
-        section_title = st.get("title", "Section")
-
-        sort += 1
-        tasks.append(
-            Task(
-                learner_id=learner_id,
-                week_number=week_number,
-                chapter=chapter_label,
-                task_type="read",
-                title=f"Read: {section_id} {section_title}",
-                sort_order=sort,
-                status="pending",
-                is_locked=True,
-                proof_policy={"min_reading_minutes": 3, "section_id": section_id},
-            )
-        )
+    common = {
+        "learner_id": learner_id,
+        "week_number": week_number,
+        "chapter": chapter_display_name(chapter_number),
+        "status": "pending",
+        "is_locked": True,
+    }
+    rows = [
+        {
+            **common,
+            "task_type": task_type,
+            "title": f"{prefix}: {st.get('id')} {st.get('title', 'Section')}",
+            "proof_policy": {**policy, "section_id": st.get("id")},
+        }
+        for st in ch_info.get("subtopics", [])
+        for task_type, prefix, policy in _SECTION_TASK_TEMPLATES
+    ]
+    rows.append(
+        {
+            **common,
+            "task_type": "test",
+            "title": f"Chapter Test: {ch_info.get('title', common['chapter'])}",
+            "proof_policy": dict(_CHAPTER_TEST_PROOF_POLICY),
+        }
+    )
+    for sort, row in enumerate(rows, start=1):
+        row["sort_order"] = sort
+    return rows
 
-        sort += 1
-        tasks.append(
-            Task(
-                learner_id=learner_id,
-                week_number=week_number,
-                chapter=chapter_label,
-                task_type="test",
-                title=f"Test: {section_id} {section_title}",
-                sort_order=sort,
-                status="pending",
-                is_locked=True,
-                proof_policy={"require_test_attempt_id": True, "section_id": section_id},
-            )
-        )
 
-    sort += 1
-    tasks.append(
-        Task(
-            learner_id=learner_id,
-            week_number=week_number,
-            chapter=chapter_label,
-            task_type="test",
-            title=f"Chapter Test: {ch_info.get('title', chapter_label)}",
-            sort_order=sort,
-            status="pending",
-            is_locked=True,
-            proof_policy={"require_test_attempt_id": True, "chapter_level": True},
-        )
-    )
-    return tasks
+async def _insert_default_week_tasks(
+    db: AsyncSession, *, learner_id: UUID, chapter: str, week_number: int
+) -> list[Task]:
+    """Insert a default chapter week in one multi-row INSERT ... RETURNING."""
+    rows = _default_week_task_rows(learner_id=learner_id, chapter=chapter, week_number=week_number)
+    return list(await db.scalars(insert(Task).returning(Task, sort_by_parameter_order=True), rows))
 
 
-def _to_task_item(task: Task) -> TaskItem:
-    return TaskItem(
-        task_id=task.id,
-        chapter=task.chapter,
-        task_type=task.task_type,
-        title=task.title,
-        week_number=task.week_number,
-        sort_order=task.sort_order,
-        status=task.status,
-        is_locked=bool(task.is_locked),
-        proof_policy=task.proof_policy or {},
-    )
+_TASK_LIST_ADAPTER = TypeAdapter(list[TaskItem])
 
 
-def _daily_breakdown_from_tasks(tasks: list[Task], week_number: int) -> list[dict]:
-    day_slots = ["Mon", "Wed", "Fri", "Sat", "Sun"]
-    if not tasks:
-        return []
-    breakdown = []
-    for idx, task in enumerate(tasks):
-        proof = task.proof_policy or {}
-        breakdown.append(
+def _to_task_items(tasks: list[Task]) -> list[TaskItem]:
+    """Validate a whole task list in one pass instead of one model at a time."""
+    return _TASK_LIST_ADAPTER.validate_python(
+        [
             {
-                "day": day_slots[idx % len(day_slots)],
-                "week_number": week_number,
-                "task_id": str(task.id),
+                "task_id": task.id,
+                "chapter": task.chapter,
                 "task_type": task.task_type,
                 "title": task.title,
+                "week_number": task.week_number,
+                "sort_order": task.sort_order,
                 "status": task.status,
-                "proof_required": bool(proof),
+                "is_locked": bool(task.is_locked),
+                "proof_policy": task.proof_policy or {},
             }
-        )
-    return breakdown
+            for task in tasks
+        ]
+    )
 
 
-async def _create_plan_version(*, db: AsyncSession, plan: WeeklyPlan, reason: str) -> None:
-    latest_version = (
-        await db.execute(
-            select(WeeklyPlanVersion.version_number)
-            .where(WeeklyPlanVersion.weekly_plan_id == plan.id)
-            .order_by(WeeklyPlanVersion.version_number.desc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
-    version_number = int(latest_version or 0) + 1
+def _task_items_json(tasks: list[Task]) -> list[dict]:
+    """Validated task items as JSON-ready dicts, for handlers that return ``ORJSONResponse``."""
+    return _TASK_LIST_ADAPTER.dump_python(_to_task_items(tasks), mode="json")
+
+
+_DAY_SLOTS = ("Mon", "Wed", "Fri", "Sat", "Sun")
+
+
+# Columns _daily_breakdown_from_tasks reads; endpoints that need nothing else
+# select these instead of full Task entities.
+_DAILY_BREAKDOWN_TASK_COLUMNS = (Task.id, Task.chapter, Task.task_type, Task.title, Task.status, Task.proof_policy)
+
+
+def _daily_breakdown_from_tasks(tasks: Sequence[Task | Row], week_number: int) -> list[dict]:
+    return [
+        {
+            "day": day,
+            "week_number": week_number,
+            "task_id": str(task.id),
+            "task_type": task.task_type,
+            "title": task.title,
+            "status": task.status,
+            "proof_required": bool(task.proof_policy),
+        }
+        for day, task in zip(cycle(_DAY_SLOTS), tasks)
+    ]
+
+
+async def _create_plan_version(
+    *, db: AsyncSession, plan: WeeklyPlan, reason: str, new_plan: bool = False
+) -> None:
+    """Queue the next version row for ``plan``.
+
+    ``new_plan`` marks a plan created in this transaction: it is version 1 by
+    definition, so the lookup (and the autoflush it would trigger) is skipped.
+    """
+    if new_plan:
+        version_number = 1
+    else:
+        latest_version = (
+            await db.execute(
+                select(WeeklyPlanVersion.version_number)
+                .where(WeeklyPlanVersion.weekly_plan_id == plan.id)
+                .order_by(WeeklyPlanVersion.version_number.desc())
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        version_number = int(latest_version or 0) + 1
     db.add(
         WeeklyPlanVersion(
             weekly_plan_id=plan.id,
@@ -824,12 +1002,17 @@ async def _create_plan_version(*, db: AsyncSession, plan: WeeklyPlan, reason: st
     )
 
 
-def _build_rough_plan(chapter_scores: dict[str, float], target_weeks: int) -> tuple[list[ChapterPlan], ChapterPlan]:
+def _build_rough_plan(chapter_scores: dict[str, float], target_weeks: int) -> tuple[list[dict], dict]:
+    """Week-by-week chapter plan as plain ``{"week", "chapter", "focus"}`` dicts.
+
+    Dicts go straight into ``plan_payload``; ``ChapterPlan`` models are only
+    built for the response, once the week dates are known.
+    """
     chapter_count = 14
     target_weeks = _clamp_weeks(target_weeks)
 
     weak_chapters = {k for k, v in chapter_scores.items() if v < 0.60}
-    plan: list[ChapterPlan] = []
+    plan: list[dict] = []
     chapter_index = 1
     for week in range(1, target_weeks + 1):
         if chapter_index <= chapter_count:
@@ -837,10 +1020,10 @@ def _build_rough_plan(chapter_scores: dict[str, float], target_weeks: int) -> tu
             focus = "learn + practice"
             if chapter_name in weak_chapters:
                 focus = "reinforce fundamentals + extra examples"
-            plan.append(ChapterPlan(week=week, chapter=chapter_name, focus=focus))
+            plan.append({"week": week, "chapter": chapter_name, "focus": focus})
             chapter_index += 1
             continue
-        plan.append(ChapterPlan(week=week, chapter="Revision", focus="mixed revision and weak-topic reinforcement"))
+        plan.append({"week": week, "chapter": "Revision", "focus": "mixed revision and weak-topic reinforcement"})
 
     first_week = plan[0]
     return plan, first_week
@@ -893,6 +1076,8 @@ async def start_onboarding(payload: OnboardingStartRequest, db: AsyncSession = D
 
     learner = Learner(name=payload.name.strip(), grade_level=payload.grade_level)
     db.add(learner)
+    # No relationship() links these models, so the unit of work does not order
+    # inserts by FK; the learner row must exist before its profile and events.
     await db.flush()
 
     profile = LearnerProfile(
@@ -934,7 +1119,7 @@ async def start_onboarding(payload: OnboardingStartRequest, db: AsyncSession = D
     redis_key = f"onboarding:attempt:{attempt_id}"
     await redis_client.set(
         redis_key,
-        json.dumps(
+        orjson.dumps(
             {
                 "answer_key": answer_key,
                 "exam_in_months": payload.exam_in_months,
@@ -963,18 +1148,20 @@ async def get_diagnostic_questions(payload: DiagnosticQuestionsRequest, db: Asyn
         raise HTTPException(status_code=400, detail="Provide learner_id or signup_draft_id.")
 
     selected_timeline_weeks = TIMELINE_MIN_WEEKS
+    profile: LearnerProfile | None = None
     if use_learner:
-        learner = (await db.execute(select(Learner).where(Learner.id == use_learner))).scalar_one_or_none()
-        profile = (
-            await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == use_learner))
-        ).scalar_one_or_none()
-        if not learner or not profile:
-            raise HTTPException(status_code=404, detail="Learner not found.")
-        existing_plan = (
+        # Learner, profile and plan-existence checks in a single round-trip.
+        has_plan = select(WeeklyPlan.id).where(WeeklyPlan.learner_id == use_learner).exists()
+        row = (
             await db.execute(
-                select(WeeklyPlan).where(WeeklyPlan.learner_id == use_learner).limit(1)
+                select(LearnerProfile, has_plan.label("has_plan"))
+                .join(Learner, Learner.id == LearnerProfile.learner_id)
+                .where(LearnerProfile.learner_id == use_learner)
             )
-        ).scalar_one_or_none()
+        ).first()
+        if row is None:
+            raise HTTPException(status_code=404, detail="Learner not found.")
+        profile, existing_plan = row
         if existing_plan:
             raise HTTPException(status_code=400, detail="Onboarding already completed; plan exists.")
         selected_timeline_weeks = _clamp_weeks(profile.selected_timeline_weeks or TIMELINE_MIN_WEEKS)
@@ -982,7 +1169,7 @@ async def get_diagnostic_questions(payload: DiagnosticQuestionsRequest, db: Asyn
         draft_raw = await redis_client.get(f"signup:draft:{use_draft}")
         if not draft_raw:
             raise HTTPException(status_code=404, detail="Signup session expired. Please start signup again.")
-        draft = json.loads(draft_raw)
+        draft = orjson.loads(draft_raw)
         selected_timeline_weeks = _clamp_weeks(int(draft.get("selected_timeline_weeks", TIMELINE_MIN_WEEKS)))
 
     from app.data.diagnostic_question_sets import get_random_diagnostic_set
@@ -990,7 +1177,6 @@ async def get_diagnostic_questions(payload: DiagnosticQuestionsRequest, db: Asyn
     questions, answer_key = get_random_diagnostic_set()
     if len(questions) < 25:
         if use_learner:
-            profile = (await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == use_learner))).scalar_one_or_none()
             math_9_percent = (profile.math_9_percent if profile else None) or 0
         else:
             math_9_percent = int(draft.get("math_9_percent", 0))
@@ -1004,6 +1190,9 @@ async def get_diagnostic_questions(payload: DiagnosticQuestionsRequest, db: Asyn
         questions = questions[:25]
         answer_key = {q.question_id: answer_key.get(q.question_id, "") for q in questions}
 
+    if not answer_key:
+        # Never store an attempt that could only be rejected at submit time.
+        raise HTTPException(status_code=503, detail="Could not generate diagnostic questions.")
     chapter_map = {q.question_id: f"Chapter {q.chapter_number or 1}" for q in questions}
 
     attempt_id = str(uuid4())
@@ -1015,7 +1204,7 @@ async def get_diagnostic_questions(payload: DiagnosticQuestionsRequest, db: Asyn
     }
     if use_draft:
         attempt_payload["signup_draft_id"] = use_draft
-    await redis_client.set(redis_key, json.dumps(attempt_payload), ex=7200)
+    await redis_client.set(redis_key, orjson.dumps(attempt_payload), ex=7200)
 
     return OnboardingStartResponse(
         learner_id=use_learner,
@@ -1041,213 +1230,210 @@ async def submit_onboarding(payload: OnboardingSubmitRequest, db: AsyncSession =
             f"idempotency:onboarding-submit:{use_learner_id or use_draft}:{payload.diagnostic_attempt_id}:{payload.idempotency_key.strip()}"
         )
         cached = await _get_idempotent_response(idempotency_cache_key)
-        if isinstance(cached, dict):
-            return OnboardingSubmitResponse(**cached)
+        if cached:
+            return OnboardingSubmitResponse.model_validate_json(cached)
 
     redis_key = f"onboarding:attempt:{payload.diagnostic_attempt_id}"
-    attempt_raw = await redis_client.get(redis_key)
+    draft_key = f"signup:draft:{use_draft}"
+    # Attempts are single-use: GETDEL consumes it atomically, so concurrent submits
+    # of one attempt cannot both build a plan. The draft rides in the same round-trip.
+    if use_draft:
+        attempt_raw, attempt_ttl, (draft_raw,) = await redis_client.getdel_and_mget(redis_key, draft_key)
+    else:
+        attempt_raw, attempt_ttl, _ = await redis_client.getdel_and_mget(redis_key)
     if not attempt_raw:
         raise HTTPException(status_code=404, detail="Diagnostic attempt not found or expired.")
 
-    time_minutes = max(1, payload.time_spent_minutes)
-    attempt = json.loads(attempt_raw)
-    answer_key: dict[str, str] = attempt.get("answer_key", {})
-    selected_timeline_weeks = _clamp_weeks(int(attempt.get("selected_timeline_weeks", TIMELINE_MIN_WEEKS)))
-    chapter_map: dict[str, str] = attempt.get("chapter_map") or {}
-
-    if not answer_key:
-        raise HTTPException(status_code=400, detail="Diagnostic answer key is unavailable.")
-
-    total = len(answer_key)
-    correct = 0
-    chapter_total: dict[str, int] = {}
-    chapter_correct: dict[str, int] = {}
-
-    for item in payload.answers:
-        expected = answer_key.get(item.question_id)
-        if expected is None:
-            continue
-        answer = (item.answer or "").strip().lower()
-        is_correct = answer == str(expected).strip().lower()
-        if is_correct:
-            correct += 1
-
-        chapter_key = chapter_map.get(item.question_id)
-        if not chapter_key:
-            chapter_match = re.search(r"_(\d+)$", item.question_id)
-            if chapter_match:
-                idx = int(chapter_match.group(1))
-                chapter_key = f"Chapter {min(14, (idx // 3) + 1)}"
-            else:
-                chapter_key = "Chapter 1"
-        chapter_total[chapter_key] = chapter_total.get(chapter_key, 0) + 1
-        if is_correct:
-            chapter_correct[chapter_key] = chapter_correct.get(chapter_key, 0) + 1
-
-    score = float(correct / max(1, total))
-    chapter_scores = {
-        ch: float(chapter_correct.get(ch, 0) / max(1, q_count))
-        for ch, q_count in chapter_total.items()
-    }
-    correct_out_of_total = f"{correct} / {total}"
-
-    if use_draft:
-        draft_raw = await redis_client.get(f"signup:draft:{use_draft}")
-        if not draft_raw:
-            raise HTTPException(status_code=404, detail="Signup session expired. Please start signup again.")
-        draft = json.loads(draft_raw)
-        from datetime import date
+    try:
+        time_minutes = max(1, payload.time_spent_minutes)
+        attempt = orjson.loads(attempt_raw)
+        answer_key: dict[str, str] = attempt.get("answer_key", {})
+        selected_timeline_weeks = _clamp_weeks(int(attempt.get("selected_timeline_weeks", TIMELINE_MIN_WEEKS)))
+        chapter_map: dict[str, str] = attempt.get("chapter_map") or {}
+
+        if not answer_key:
+            # Attempts are only stored with a non-empty key, so this is a corrupted entry.
+            logger.error("event=diagnostic_answer_key_missing attempt_id=%s", payload.diagnostic_attempt_id)
+            raise HTTPException(status_code=400, detail="Diagnostic answer key is unavailable.")
+
+        total = len(answer_key)
+        correct = 0
+        chapter_total: defaultdict[str, int] = defaultdict(int)
+        chapter_correct: defaultdict[str, int] = defaultdict(int)
+        # Normalize expected answers once instead of per submitted answer.
+        normalized_key = {qid: str(expected).strip().lower() for qid, expected in answer_key.items()}
+
+        for item in payload.answers:
+            expected = normalized_key.get(item.question_id)
+            if expected is None:
+                continue
+            is_correct = (item.answer or "").strip().lower() == expected
+            if is_correct:
+                correct += 1
+
+            chapter_key = chapter_map.get(item.question_id)
+            if not chapter_key:
+                # Legacy attempts without a chapter_map: ids end in "_<question index>".
+                _, sep, suffix = item.question_id.rpartition("_")
+                if sep and suffix.isdecimal():
+                    chapter_key = f"Chapter {min(14, (int(suffix) // 3) + 1)}"
+                else:
+                    chapter_key = "Chapter 1"
+            chapter_total[chapter_key] += 1
+            if is_correct:
+                chapter_correct[chapter_key] += 1
+
+        score = float(correct / max(1, total))
+        chapter_scores = {
+            ch: float(chapter_correct.get(ch, 0) / max(1, q_count))
+            for ch, q_count in chapter_total.items()
+        }
+        correct_out_of_total = f"{correct} / {total}"
+
+        if use_draft:
+            if not draft_raw:
+                raise HTTPException(status_code=404, detail="Signup session expired. Please start signup again.")
+            draft = orjson.loads(draft_raw)
+            from datetime import date
+
+            learner = Learner(name=draft["name"], grade_level="10")
+            db.add(learner)
+            await db.flush()
+            profile = LearnerProfile(
+                learner_id=learner.id,
+                concept_mastery={},
+                retention_decay=0.1,
+                cognitive_depth=0.5,
+                engagement_score=0.5,
+                selected_timeline_weeks=selected_timeline_weeks,
+                recommended_timeline_weeks=None,
+                current_forecast_weeks=None,
+                timeline_delta_weeks=None,
+                math_9_percent=int(draft.get("math_9_percent", 0)),
+                onboarding_date=canonical_today(),
+                student_email=(draft.get("student_email") or "").strip().lower() or None,
+                progress_status="onboarding_completed",
+                progress_percentage=0.0,
+                reminder_enabled=True,
+            )
+            db.add(profile)
+            auth = StudentAuth(
+                username=draft["username"],
+                password_hash=draft["password_hash"],
+                name=draft["name"],
+                date_of_birth=date.fromisoformat(draft["date_of_birth"]),
+                learner_id=learner.id,
+            )
+            db.add(auth)
+            use_learner_id = learner.id
+            _auth_for_token = auth
+        else:
+            row = (
+                await db.execute(
+                    select(Learner, LearnerProfile)
+                    .join(LearnerProfile, LearnerProfile.learner_id == Learner.id)
+                    .where(Learner.id == use_learner_id)
+                )
+            ).first()
+            if row is None:
+                raise HTTPException(status_code=404, detail="Learner profile not found.")
+            learner, profile = row
+            _auth_for_token = None
 
-        learner = Learner(name=draft["name"], grade_level="10")
-        db.add(learner)
-        await db.flush()
-        profile = LearnerProfile(
-            learner_id=learner.id,
-            concept_mastery={},
-            retention_decay=0.1,
-            cognitive_depth=0.5,
-            engagement_score=0.5,
-            selected_timeline_weeks=selected_timeline_weeks,
-            recommended_timeline_weeks=None,
-            current_forecast_weeks=None,
-            timeline_delta_weeks=None,
-            math_9_percent=int(draft.get("math_9_percent", 0)),
-            onboarding_date=canonical_today(),
-            student_email=(draft.get("student_email") or "").strip().lower() or None,
-            progress_status="onboarding_completed",
-            progress_percentage=0.0,
-            reminder_enabled=True,
+        _log_engagement_event(
+            db=db,
+            learner_id=use_learner_id,
+            event_type="test_submission",
+            duration_minutes=time_minutes,
+            details={"source": "onboarding_submit", "score": score},
         )
-        db.add(profile)
-        auth = StudentAuth(
-            username=draft["username"],
-            password_hash=draft["password_hash"],
-            name=draft["name"],
-            date_of_birth=date.fromisoformat(draft["date_of_birth"]),
-            learner_id=learner.id,
+
+        math_9_percent = profile.math_9_percent or 0
+        recommended_timeline_weeks, recommendation_note = await _recommend_timeline_via_mcp(
+            selected_timeline_weeks,
+            score,
         )
-        db.add(auth)
-        await db.flush()
-        use_learner_id = learner.id
-        _auth_for_token = auth
+        current_forecast_weeks = recommended_timeline_weeks
+        timeline_delta_weeks = current_forecast_weeks - selected_timeline_weeks
+        # Stored on the plan, the forecast and in the response under the same keys.
+        timeline = {
+            "selected_timeline_weeks": selected_timeline_weeks,
+            "recommended_timeline_weeks": recommended_timeline_weeks,
+            "current_forecast_weeks": current_forecast_weeks,
+            "timeline_delta_weeks": timeline_delta_weeks,
+        }
+        rough_plan, week_1 = _build_rough_plan(chapter_scores, target_weeks=current_forecast_weeks)
+    except Exception:
+        # Failed before anything was committed: put the attempt back so it can be resubmitted.
         try:
-            await redis_client.delete(f"signup:draft:{use_draft}")
+            await redis_client.set(redis_key, attempt_raw, ex=attempt_ttl if attempt_ttl > 0 else None)
         except Exception:
             pass
-    else:
-        learner = (await db.execute(select(Learner).where(Learner.id == use_learner_id))).scalar_one_or_none()
-        profile = (
-            await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == use_learner_id))
-        ).scalar_one_or_none()
-        if learner is None or profile is None:
-            raise HTTPException(status_code=404, detail="Learner profile not found.")
-        _auth_for_token = None
-
-    # Combine diagnostic score with Class 9 maths percentage to shape initial profile (global profile).
-    math_9 = float(profile.math_9_percent or 0) / 100.0
-    ability = 0.5 * score + 0.5 * math_9
-    profile.cognitive_depth = max(0.1, min(1.0, 0.3 + (0.7 * ability)))
-    profile.onboarding_diagnostic_score = round(score, 4)
-    _log_engagement_event(
-        db=db,
-        learner_id=use_learner_id,
-        event_type="test_submission",
-        duration_minutes=time_minutes,
-        details={"source": "onboarding_submit", "score": score},
-    )
+        raise
 
-    math_9_percent = float(profile.math_9_percent or 0)
-    recommended_timeline_weeks, recommendation_note = await _recommend_timeline_via_mcp(
-        selected_timeline_weeks,
-        score,
-    )
-    current_forecast_weeks = recommended_timeline_weeks
-    timeline_delta_weeks = current_forecast_weeks - selected_timeline_weeks
-    rough_plan, week_1 = _build_rough_plan(chapter_scores, target_weeks=current_forecast_weeks)
-    await redis_client.delete(redis_key)
-
-    # 1. Update Profile (including all 14 chapters in mastery)
-    mastery = {}
-    for ch_data in SYLLABUS_CHAPTERS:
-        ch_key = chapter_display_name(ch_data["number"])
-        # All chapters start at 0.0 — diagnostic score is used only for
-        # cognitive_depth and plan pacing, NOT for chapter mastery.
-        mastery[ch_key] = 0.0
-    
+    if use_draft:
+        await redis_client.delete(draft_key)
+
+    # 1. Update Profile (all 14 chapters in mastery; cognitive depth blends diagnostic score and Class 9 maths)
+    mastery = dict(_INITIAL_MASTERY)
     profile.onboarding_diagnostic_score = score
-    profile.math_9_percent = int(math_9_percent)
+    if profile.math_9_percent is None:
+        profile.math_9_percent = 0
     profile.selected_timeline_weeks = selected_timeline_weeks
     profile.recommended_timeline_weeks = recommended_timeline_weeks
-    profile.current_forecast_weeks = recommended_timeline_weeks
-    profile.timeline_delta_weeks = recommended_timeline_weeks - selected_timeline_weeks
+    profile.current_forecast_weeks = current_forecast_weeks
+    profile.timeline_delta_weeks = timeline_delta_weeks
     profile.concept_mastery = mastery
-    profile.cognitive_depth = round(float(0.5 * score + 0.5 * (math_9_percent / 100.0)), 3)
-    profile.last_updated = datetime.now(timezone.utc)
+    profile.cognitive_depth = round(0.5 * score + 0.5 * (math_9_percent / 100.0), 3)
     if profile.onboarding_date is None:
         profile.onboarding_date = canonical_today()
     profile.progress_status = "in_progress"
     profile.progress_percentage = round(float((1 / 14) * 100.0), 2)
 
-    # 2. Initialize all 14 Chapters in Progression
-    for ch_data in SYLLABUS_CHAPTERS:
-        ch_key = chapter_display_name(ch_data["number"])
-        ch_score = mastery[ch_key]
-        
-        # Create ChapterProgression for each
-        existing_cp = (await db.execute(
-            select(ChapterProgression).where(
-                ChapterProgression.learner_id == use_learner_id,
-                ChapterProgression.chapter == ch_key
-            )
-        )).scalar_one_or_none()
-        
-        if not existing_cp:
-            db.add(ChapterProgression(
-                learner_id=use_learner_id,
-                chapter=ch_key,
-                status="not_started" if ch_data["number"] > 1 else "in_progress",
-                attempt_count=0,
-                best_score=ch_score,
-                last_score=ch_score
-            ))
-
-    # 3. Create Plan and Initial Tasks
+    # 2. Initialize all 14 Chapters in Progression (single insert; existing rows are kept)
+    progress_rows = [
+        {
+            "learner_id": use_learner_id,
+            "chapter": ch_key,
+            "status": "not_started" if ch_data["number"] > 1 else "in_progress",
+            "attempt_count": 0,
+            "best_score": mastery[ch_key],
+            "last_score": mastery[ch_key],
+        }
+        for ch_data, ch_key in zip(SYLLABUS_CHAPTERS, _CHAPTER_KEYS)
+    ]
+    await db.execute(
+        pg_insert(ChapterProgression)
+        .values(progress_rows)
+        .on_conflict_do_nothing(index_elements=[ChapterProgression.learner_id, ChapterProgression.chapter])
+    )
+
+    # 3. Create Plan (with its forecast), then its first version and the initial tasks
     plan = WeeklyPlan(
         learner_id=use_learner_id,
         status="active",
         current_week=1,
         total_weeks=len(rough_plan),
-        plan_payload={
-            "rough_plan": [item.model_dump() for item in rough_plan],
-            "timeline": {
-                "selected_timeline_weeks": selected_timeline_weeks,
-                "recommended_timeline_weeks": recommended_timeline_weeks,
-                "current_forecast_weeks": current_forecast_weeks,
-                "timeline_delta_weeks": timeline_delta_weeks,
-            },
-        },
+        plan_payload={"rough_plan": rough_plan, "timeline": timeline},
     )
-    db.add(plan)
-    await db.flush()
-    await _create_plan_version(db=db, plan=plan, reason="onboarding_initial_plan")
-    
-    week_tasks = _default_week_tasks(learner_id=use_learner_id, chapter=week_1.chapter, week_number=1)
-    for task in week_tasks:
-        db.add(task)
-        
-    db.add(
+    db.add_all([
+        plan,
         WeeklyForecast(
             learner_id=use_learner_id,
             week_number=1,
-            selected_timeline_weeks=selected_timeline_weeks,
-            recommended_timeline_weeks=recommended_timeline_weeks,
-            current_forecast_weeks=current_forecast_weeks,
-            timeline_delta_weeks=timeline_delta_weeks,
+            **timeline,
             pacing_status=_pacing_status(timeline_delta_weeks),
             reason="initial_onboarding_forecast",
-        )
+        ),
+    ])
+    # The version row references the plan and inserts are not FK-ordered (no relationships).
+    await db.flush()
+    await _create_plan_version(db=db, plan=plan, reason="onboarding_initial_plan", new_plan=True)
+
+    week_tasks = await _insert_default_week_tasks(
+        db, learner_id=use_learner_id, chapter=week_1["chapter"], week_number=1
     )
-    
+
     await _update_profile_after_outcome(
         db=db,
         learner_id=use_learner_id,
@@ -1257,12 +1443,14 @@ async def submit_onboarding(payload: OnboardingSubmitRequest, db: AsyncSession =
         engagement_minutes=time_minutes,
         extra={"diagnostic_score": score, "math_9_percent": profile.math_9_percent},
     )
-    await log_agent_decision(
-        db=db,
+    await db.commit()
+    await invalidate_learner_engagement_stats(use_learner_id)
+    # The decision log is observability only; keep its flush off the response path.
+    run_detached(log_agent_decision_detached(
         learner_id=use_learner_id,
         agent_name="onboarding",
         decision_type="onboarding_plan_created",
-        chapter=week_1.chapter,
+        chapter=week_1["chapter"],
         input_snapshot={
             "diagnostic_score": score,
             "selected_timeline_weeks": selected_timeline_weeks,
@@ -1272,43 +1460,32 @@ async def submit_onboarding(payload: OnboardingSubmitRequest, db: AsyncSession =
             "recommended_timeline_weeks": recommended_timeline_weeks,
             "current_forecast_weeks": current_forecast_weeks,
             "timeline_delta_weeks": timeline_delta_weeks,
-            "week_1_chapter": week_1.chapter,
+            "week_1_chapter": week_1["chapter"],
         },
-    )
-    await db.commit()
+    ))
 
     token = create_token(use_learner_id, _auth_for_token.username) if _auth_for_token else None
     onboarding_date = _resolve_onboarding_date(profile)
     enriched_rough_plan: list[ChapterPlan] = []
     for item in rough_plan:
-        week_start, week_end = week_bounds_from_onboarding(onboarding_date, item.week)
+        week_start, week_end = week_bounds_from_onboarding(onboarding_date, item["week"])
         enriched_rough_plan.append(
-            item.model_copy(
-                update={
-                    "week_start_date": week_start.isoformat(),
-                    "week_end_date": week_end.isoformat(),
-                    "week_label": format_week_label(item.week, week_start, week_end),
-                }
+            ChapterPlan(
+                **item,
+                week_start_date=week_start.isoformat(),
+                week_end_date=week_end.isoformat(),
+                week_label=format_week_label(item["week"], week_start, week_end),
             )
         )
-    week1_start, week1_end = week_bounds_from_onboarding(onboarding_date, week_1.week)
-    week1_enriched = week_1.model_copy(
-        update={
-            "week_start_date": week1_start.isoformat(),
-            "week_end_date": week1_end.isoformat(),
-            "week_label": format_week_label(week_1.week, week1_start, week1_end),
-        }
-    )
+    # The committed first week is the first entry of the enriched plan.
+    week1_enriched = enriched_rough_plan[0]
 
     response = OnboardingSubmitResponse(
         learner_id=use_learner_id,
         score=score,
         correct_out_of_total=correct_out_of_total,
         token=token,
-        selected_timeline_weeks=selected_timeline_weeks,
-        recommended_timeline_weeks=recommended_timeline_weeks,
-        current_forecast_weeks=current_forecast_weeks,
-        timeline_delta_weeks=timeline_delta_weeks,
+        **timeline,
         timeline_recommendation_note=recommendation_note,
         chapter_scores=chapter_scores,
         profile_snapshot={
@@ -1324,56 +1501,65 @@ async def submit_onboarding(payload: OnboardingSubmitRequest, db: AsyncSession =
             "diagnostic_score": score,
             "onboarding_diagnostic_score": profile.onboarding_diagnostic_score,
             "chapter_mastery": chapter_scores,
-            "selected_timeline_weeks": selected_timeline_weeks,
-            "recommended_timeline_weeks": recommended_timeline_weeks,
-            "current_forecast_weeks": current_forecast_weeks,
-            "timeline_delta_weeks": timeline_delta_weeks,
+            **timeline,
         },
         rough_plan=enriched_rough_plan,
         current_week_schedule=week1_enriched,
-        current_week_tasks=[_to_task_item(task) for task in week_tasks],
+        current_week_tasks=_to_task_items(week_tasks),
     )
     if idempotency_cache_key:
-        await _set_idempotent_response(idempotency_cache_key, response.model_dump(mode="json"))
+        await _set_idempotent_response(idempotency_cache_key, response.model_dump_json())
     return response
 
 
 @router.get("/plan/{learner_id}", response_model=WeeklyPlanResponse)
 async def get_latest_plan(learner_id: UUID, db: AsyncSession = Depends(get_db)):
+    # Latest plan's columns plus the profile's onboarding date as one plain row.
     row = (
         await db.execute(
-            select(WeeklyPlan)
+            select(
+                WeeklyPlan.learner_id,
+                WeeklyPlan.current_week,
+                WeeklyPlan.total_weeks,
+                WeeklyPlan.plan_payload,
+                LearnerProfile.learner_id.label("profile_learner_id"),
+                LearnerProfile.onboarding_date,
+            )
+            .outerjoin(LearnerProfile, LearnerProfile.learner_id == WeeklyPlan.learner_id)
             .where(WeeklyPlan.learner_id == learner_id)
             .order_by(WeeklyPlan.generated_at.desc())
             .limit(1)
         )
-    ).scalar_one_or_none()
+    ).first()
     if row is None:
         raise HTTPException(status_code=404, detail="No weekly plan found for learner.")
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == learner_id))
-    ).scalar_one_or_none()
-    if profile is None:
+    if row.profile_learner_id is None:
         raise HTTPException(status_code=404, detail="Learner profile not found.")
 
     rough = row.plan_payload.get("rough_plan", []) if isinstance(row.plan_payload, dict) else []
-    week_start_overrides = _extract_week_start_overrides(row.plan_payload if isinstance(row.plan_payload, dict) else {})
-    onboarding_date = _resolve_onboarding_date(profile)
+    week_start_overrides = _extract_week_start_overrides(row.plan_payload)
+    onboarding_date = row.onboarding_date or canonical_today()
+    # One pass over the rough plan: enrich each week, then bucket it for the response.
     parsed: list[ChapterPlan] = []
+    committed_week_schedule: ChapterPlan | None = None
+    forecast_plan: list[ChapterPlan] = []
+    timeline_map: dict[int, dict] = {}
     for item in rough:
         cp = ChapterPlan(**item)
         start, end = week_bounds_from_plan(onboarding_date, cp.week, week_start_overrides)
-        parsed.append(
-            cp.model_copy(
-                update={
-                    "week_start_date": start.isoformat(),
-                    "week_end_date": end.isoformat(),
-                    "week_label": format_week_label(cp.week, start, end),
-                }
-            )
+        cp = cp.model_copy(
+            update={
+                "week_start_date": start.isoformat(),
+                "week_end_date": end.isoformat(),
+                "week_label": format_week_label(cp.week, start, end),
+            }
         )
-    committed_week_schedule = next((item for item in parsed if item.week == row.current_week), None)
-    forecast_plan = [item for item in parsed if item.week > row.current_week]
+        parsed.append(cp)
+        if cp.week == row.current_week and committed_week_schedule is None:
+            committed_week_schedule = cp
+        elif cp.week > row.current_week:
+            forecast_plan.append(cp)
+        timeline_map[int(cp.week)] = {"chapter": cp.chapter, "focus": cp.focus}
     timeline = row.plan_payload.get("timeline", {}) if isinstance(row.plan_payload, dict) else {}
     tasks = (
         await db.execute(
@@ -1384,10 +1570,6 @@ async def get_latest_plan(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     ).scalars().all()
     estimate_weeks = timeline.get("current_forecast_weeks")
     selected_weeks = timeline.get("selected_timeline_weeks")
-    timeline_map = {
-        int(item.week): {"chapter": item.chapter, "focus": item.focus}
-        for item in parsed
-    }
     viz = _build_timeline_visualization(
         onboarding_date=onboarding_date,
         total_weeks=row.total_weeks,
@@ -1411,7 +1593,7 @@ async def get_latest_plan(learner_id: UUID, db: AsyncSession = Depends(get_db)):
         rough_plan=parsed,
         committed_week_schedule=committed_week_schedule,
         forecast_plan=forecast_plan,
-        current_week_tasks=[_to_task_item(task) for task in tasks],
+        current_week_tasks=_to_task_items(tasks),
         current_week_daily_breakdown=_daily_breakdown_from_tasks(tasks, row.current_week),
         onboarding_date=onboarding_date.isoformat(),
         timeline_timezone=str(TIMELINE_TZ),
@@ -1451,29 +1633,33 @@ async def weekly_replan(payload: WeeklyReplanRequest, db: AsyncSession = Depends
             f"idempotency:weekly-replan:{payload.learner_id}:{payload.evaluation.chapter}:{payload.idempotency_key.strip()}"
         )
         cached = await _get_idempotent_response(idempotency_cache_key)
-        if isinstance(cached, dict):
-            return WeeklyReplanResponse(**cached)
-
-    learner = (await db.execute(select(Learner).where(Learner.id == payload.learner_id))).scalar_one_or_none()
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == payload.learner_id))
-    ).scalar_one_or_none()
-    if learner is None or profile is None:
-        raise HTTPException(status_code=404, detail="Learner profile not found.")
+        if cached:
+            return WeeklyReplanResponse.model_validate_json(cached)
 
     chapter = payload.evaluation.chapter.strip()
     score = payload.evaluation.score
     threshold = payload.threshold
     max_attempts = payload.max_attempts
 
-    progress = (
+    # Learner check, profile and this chapter's progression in a single round-trip.
+    row = (
         await db.execute(
-            select(ChapterProgression).where(
-                ChapterProgression.learner_id == payload.learner_id,
-                ChapterProgression.chapter == chapter,
+            select(LearnerProfile, ChapterProgression)
+            .join(Learner, Learner.id == LearnerProfile.learner_id)
+            .outerjoin(
+                ChapterProgression,
+                and_(
+                    ChapterProgression.learner_id == LearnerProfile.learner_id,
+                    ChapterProgression.chapter == chapter,
+                ),
             )
+            .where(LearnerProfile.learner_id == payload.learner_id)
+            .limit(1)
         )
-    ).scalar_one_or_none()
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Learner profile not found.")
+    profile, progress = row
     if progress is None:
         progress = ChapterProgression(
             learner_id=payload.learner_id,
@@ -1538,7 +1724,6 @@ async def weekly_replan(payload: WeeklyReplanRequest, db: AsyncSession = Depends
     progress.last_score = score
     progress.status = decision
     progress.revision_queued = decision == "proceed_with_revision_queue"
-    progress.updated_at = datetime.now(timezone.utc)
 
     selected_weeks = int(profile.selected_timeline_weeks or TIMELINE_MIN_WEEKS)
     recommended_weeks = int(profile.recommended_timeline_weeks or selected_weeks)
@@ -1564,20 +1749,17 @@ async def weekly_replan(payload: WeeklyReplanRequest, db: AsyncSession = Depends
         )
     ).scalar_one_or_none()
     if latest_plan and isinstance(latest_plan.plan_payload, dict):
-        plan_payload = dict(latest_plan.plan_payload)
-        timeline = dict(plan_payload.get("timeline", {}))
-        timeline.update(
-            {
-                "selected_timeline_weeks": selected_weeks,
-                "recommended_timeline_weeks": recommended_weeks,
-                "current_forecast_weeks": current_forecast_weeks,
-                "timeline_delta_weeks": timeline_delta_weeks,
-                "pacing_status": pacing_status,
-            }
-        )
-        plan_payload["timeline"] = timeline
-        latest_plan.plan_payload = plan_payload
+        timeline = {
+            **(latest_plan.plan_payload.get("timeline") or {}),
+            "selected_timeline_weeks": selected_weeks,
+            "recommended_timeline_weeks": recommended_weeks,
+            "current_forecast_weeks": current_forecast_weeks,
+            "timeline_delta_weeks": timeline_delta_weeks,
+            "pacing_status": pacing_status,
+        }
+        latest_plan.plan_payload = {**latest_plan.plan_payload, "timeline": timeline}
         latest_plan.total_weeks = max(latest_plan.total_weeks, current_forecast_weeks)
+        # Every replan is recorded in plan history, even when the timeline did not move.
         await _create_plan_version(db=db, plan=latest_plan, reason="weekly_replan_update")
 
     db.add(
@@ -1611,6 +1793,7 @@ async def weekly_replan(payload: WeeklyReplanRequest, db: AsyncSession = Depends
         },
     )
     await db.commit()
+    await invalidate_learner_engagement_stats(payload.learner_id)
 
     response = WeeklyReplanResponse(
         learner_id=payload.learner_id,
@@ -1628,11 +1811,11 @@ async def weekly_replan(payload: WeeklyReplanRequest, db: AsyncSession = Depends
         revision_queue=revision_queue,
     )
     if idempotency_cache_key:
-        await _set_idempotent_response(idempotency_cache_key, response.model_dump(mode="json"))
+        await _set_idempotent_response(idempotency_cache_key, response.model_dump_json())
     return response
 
 
-@router.get("/revision-queue/{learner_id}")
+@router.get("/revision-queue/{learner_id}", response_class=ORJSONResponse)
 async def get_revision_queue(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     rows = (
         await db.execute(
@@ -1641,18 +1824,18 @@ async def get_revision_queue(learner_id: UUID, db: AsyncSession = Depends(get_db
             .order_by(RevisionQueueItem.priority.desc(), RevisionQueueItem.created_at.asc())
         )
     ).scalars().all()
-    return {
+    return ORJSONResponse({
         "learner_id": learner_id,
         "items": [
-            RevisionQueueItemResponse(
-                chapter=row.chapter,
-                status=row.status,
-                priority=row.priority,
-                reason=row.reason,
-            )
+            {
+                "chapter": row.chapter,
+                "status": row.status,
+                "priority": row.priority,
+                "reason": row.reason,
+            }
             for row in rows
         ],
-    }
+    })
 
 
 @router.get("/revision-policy/{learner_id}", response_model=RevisionPolicyStateResponse)
@@ -1737,7 +1920,7 @@ async def advance_chapter(payload: ChapterAdvanceRequest, db: AsyncSession = Dep
     )
 
 
-@router.get("/tasks/{learner_id}")
+@router.get("/tasks/{learner_id}", response_class=ORJSONResponse)
 async def list_current_week_tasks(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
     if learner is None:
@@ -1761,10 +1944,10 @@ async def list_current_week_tasks(learner_id: UUID, db: AsyncSession = Depends(g
         )
         db.add(plan)
         await db.flush()
-        await _create_plan_version(db=db, plan=plan, reason="system_bootstrap_current_week")
-        for task in _default_week_tasks(learner_id=learner_id, chapter="Chapter 1", week_number=1):
-            db.add(task)
+        await _create_plan_version(db=db, plan=plan, reason="system_bootstrap_current_week", new_plan=True)
+        await _insert_default_week_tasks(db, learner_id=learner_id, chapter="Chapter 1", week_number=1)
         await db.commit()
+        await invalidate_learner_engagement_stats(learner_id)
 
     tasks = (
         await db.execute(
@@ -1779,7 +1962,7 @@ async def list_current_week_tasks(learner_id: UUID, db: AsyncSession = Depends(g
     onboarding_date = _resolve_onboarding_date(profile) if profile else canonical_today()
     week_start_overrides = _extract_week_start_overrides(plan.plan_payload if isinstance(plan.plan_payload, dict) else {})
     week_start, week_end = week_bounds_from_plan(onboarding_date, plan.current_week, week_start_overrides)
-    return {
+    return ORJSONResponse({
         "learner_id": learner_id,
         "week_number": plan.current_week,
         "week_label": format_week_label(plan.current_week, week_start, week_end),
@@ -1787,9 +1970,9 @@ async def list_current_week_tasks(learner_id: UUID, db: AsyncSession = Depends(g
         "week_end_date": week_end.isoformat(),
         "is_committed_week": True,
         "forecast_read_only": True,
-        "tasks": [_to_task_item(task) for task in tasks],
+        "tasks": _task_items_json(tasks),
         "daily_breakdown": _daily_breakdown_from_tasks(tasks, plan.current_week),
-    }
+    })
 
 
 @router.get("/syllabus")
@@ -1798,21 +1981,34 @@ async def get_syllabus():
     return {"chapters": get_syllabus_for_api()}
 
 
-@router.get("/schedule/{learner_id}")
-async def get_full_schedule(learner_id: UUID, db: AsyncSession = Depends(get_db)):
-    """Return full schedule: all weeks with tasks and timeline (read-only for student)."""
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    if learner is None:
-        raise HTTPException(status_code=404, detail="Learner not found.")
+async def _iter_schedule_ndjson(summary: dict, weeks: list[dict]):
+    """Yield the schedule summary, then one week per line, as NDJSON."""
+    yield orjson.dumps(summary) + b"\n"
+    for week in weeks:
+        yield orjson.dumps(week) + b"\n"
 
-    plan = (
+
+@router.get("/schedule/{learner_id}", response_class=ORJSONResponse)
+async def get_full_schedule(
+    learner_id: UUID,
+    stream: bool = Query(False, description="Stream as NDJSON: a summary line, then one line per week"),
+    db: AsyncSession = Depends(get_db),
+):
+    """Return full schedule: all weeks with tasks and timeline (read-only for student)."""
+    # Learner check and latest plan in a single round-trip.
+    row = (
         await db.execute(
-            select(WeeklyPlan)
-            .where(WeeklyPlan.learner_id == learner_id)
-            .order_by(WeeklyPlan.generated_at.desc())
+            select(Learner.id, WeeklyPlan)
+            .outerjoin(WeeklyPlan, WeeklyPlan.learner_id == Learner.id)
+            .where(Learner.id == learner_id)
+            .order_by(WeeklyPlan.generated_at.desc().nulls_last())
             .limit(1)
         )
-    ).scalar_one_or_none()
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Learner not found.")
+
+    _, plan = row
     if plan is None:
         plan = WeeklyPlan(
             learner_id=learner_id,
@@ -1823,15 +2019,10 @@ async def get_full_schedule(learner_id: UUID, db: AsyncSession = Depends(get_db)
         )
         db.add(plan)
         await db.flush()
-        await _create_plan_version(db=db, plan=plan, reason="system_bootstrap_current_week")
-        for task in _default_week_tasks(learner_id=learner_id, chapter="Chapter 1", week_number=1):
-            db.add(task)
+        await _create_plan_version(db=db, plan=plan, reason="system_bootstrap_current_week", new_plan=True)
+        await _insert_default_week_tasks(db, learner_id=learner_id, chapter="Chapter 1", week_number=1)
         await db.commit()
-        plan = (
-            await db.execute(
-                select(WeeklyPlan).where(WeeklyPlan.learner_id == learner_id).order_by(WeeklyPlan.generated_at.desc()).limit(1)
-            )
-        ).scalar_one()
+        await invalidate_learner_engagement_stats(learner_id)
 
     rough = (plan.plan_payload or {}).get("rough_plan", [])
     if not rough:
@@ -1846,8 +2037,8 @@ async def get_full_schedule(learner_id: UUID, db: AsyncSession = Depends(get_db)
         )
     ).scalars().all()
     tasks_by_week = {}
-    for t in all_tasks:
-        tasks_by_week.setdefault(t.week_number, []).append(_to_task_item(t))
+    for item in _task_items_json(all_tasks):
+        tasks_by_week.setdefault(item["week_number"], []).append(item)
 
     current = int(plan.current_week)
     total = int(plan.total_weeks or 14)
@@ -1876,17 +2067,45 @@ async def get_full_schedule(learner_id: UUID, db: AsyncSession = Depends(get_db)
         current_week=current,
         total_weeks_forecast=(plan.plan_payload or {}).get("timeline", {}).get("current_forecast_weeks") or total,
     )
-    return {
+    summary = {
         "learner_id": learner_id,
         "onboarding_date": onboarding_date.isoformat(),
         "timeline_timezone": str(TIMELINE_TZ),
         "current_week": current,
         "total_weeks": total,
-        "timeline_visualization": weeks_list,
         "completion_estimate_date_active_pace": completion["estimated_completion_date"],
         "completion_estimate_weeks_active_pace": completion["completion_estimate_weeks_active_pace"],
-        "weeks": weeks_list,
     }
+    if stream:
+        return StreamingResponse(_iter_schedule_ndjson(summary, weeks_list), media_type="application/x-ndjson")
+    return ORJSONResponse({**summary, "timeline_visualization": weeks_list, "weeks": weeks_list})
+
+
+def _reading_proof(policy: dict, payload: TaskCompletionRequest) -> tuple[bool, str]:
+    required_minutes = int(policy.get("min_reading_minutes", 0))
+    if int(payload.reading_minutes) >= required_minutes:
+        return True, "reading_proof_ok"
+    return False, f"min_reading_minutes_{required_minutes}_required"
+
+
+def _test_proof(policy: dict, payload: TaskCompletionRequest) -> tuple[bool, str]:
+    if not policy.get("require_test_attempt_id", True) or (payload.test_attempt_id or "").strip():
+        return True, "test_proof_ok"
+    return False, "test_attempt_id_required"
+
+
+def _notes_proof(policy: dict, payload: TaskCompletionRequest) -> tuple[bool, str]:
+    if (payload.notes or "").strip():
+        return True, "notes_proof_ok"
+    return False, "notes_required"
+
+
+# task_type -> proof check returning (accepted, reason); other types need notes.
+_PROOF_HANDLERS = {
+    "read": _reading_proof,
+    "practice": _reading_proof,
+    "test": _test_proof,
+}
 
 
 @router.post("/tasks/{task_id}/complete", response_model=TaskCompletionResponse)
@@ -1897,8 +2116,8 @@ async def complete_task(task_id: UUID, payload: TaskCompletionRequest, db: Async
             f"idempotency:task-complete:{payload.learner_id}:{task_id}:{payload.idempotency_key.strip()}"
         )
         cached = await _get_idempotent_response(idempotency_cache_key)
-        if isinstance(cached, dict):
-            return TaskCompletionResponse(**cached)
+        if cached:
+            return TaskCompletionResponse.model_validate_json(cached)
 
     task = (await db.execute(select(Task).where(Task.id == task_id))).scalar_one_or_none()
     if task is None:
@@ -1937,24 +2156,11 @@ async def complete_task(task_id: UUID, payload: TaskCompletionRequest, db: Async
             status=task.status,
         )
         if idempotency_cache_key:
-            await _set_idempotent_response(idempotency_cache_key, response.model_dump(mode="json"))
+            await _set_idempotent_response(idempotency_cache_key, response.model_dump_json())
         return response
 
-    policy = task.proof_policy or {}
-    accepted = False
-    reason = ""
-    if task.task_type in ("read", "practice"):
-        required_minutes = int(policy.get("min_reading_minutes", 0))
-        accepted = int(payload.reading_minutes) >= required_minutes
-        reason = "reading_proof_ok" if accepted else f"min_reading_minutes_{required_minutes}_required"
-    elif task.task_type == "test":
-        required = bool(policy.get("require_test_attempt_id", True))
-        has_attempt = bool((payload.test_attempt_id or "").strip())
-        accepted = (not required) or has_attempt
-        reason = "test_proof_ok" if accepted else "test_attempt_id_required"
-    else:
-        accepted = bool((payload.notes or "").strip())
-        reason = "notes_proof_ok" if accepted else "notes_required"
+    proof_check = _PROOF_HANDLERS.get(task.task_type, _notes_proof)
+    accepted, reason = proof_check(task.proof_policy or {}, payload)
 
     db.add(
         TaskAttempt(
@@ -1969,9 +2175,6 @@ async def complete_task(task_id: UUID, payload: TaskCompletionRequest, db: Async
             reason=reason,
         )
     )
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == payload.learner_id))
-    ).scalar_one_or_none()
     if accepted:
         task.status = "completed"
         task.completed_at = datetime.now(timezone.utc)
@@ -1989,6 +2192,9 @@ async def complete_task(task_id: UUID, payload: TaskCompletionRequest, db: Async
                 "proof_reason": reason,
             },
         )
+        # Primary-key get: served from the identity map when already loaded, and
+        # skipped entirely for rejected proofs.
+        profile = await db.get(LearnerProfile, payload.learner_id)
         if profile is not None:
             await _update_profile_after_outcome(
                 db=db,
@@ -1999,24 +2205,34 @@ async def complete_task(task_id: UUID, payload: TaskCompletionRequest, db: Async
                 extra={"task_id": str(task.id), "task_type": task.task_type},
             )
     await db.commit()
-    await db.refresh(task)
+    await invalidate_learner_engagement_stats(payload.learner_id)
+    # Sessions keep attributes after commit and status was set locally, so no refresh.
     response = TaskCompletionResponse(
         learner_id=payload.learner_id,
-        task_id=task.id,
+        task_id=task_id,
         accepted=accepted,
         reason=reason,
         status=task.status,
     )
     if idempotency_cache_key:
-        await _set_idempotent_response(idempotency_cache_key, response.model_dump(mode="json"))
+        await _set_idempotent_response(idempotency_cache_key, response.model_dump_json())
     return response
 
 
 @router.post("/engagement/events", response_model=EngagementEventResponse)
 async def ingest_engagement_event(payload: EngagementEventRequest, db: AsyncSession = Depends(get_db)):
-    learner = (await db.execute(select(Learner).where(Learner.id == payload.learner_id))).scalar_one_or_none()
-    if learner is None:
+    # Learner check and profile load in one round-trip, before the event is
+    # queued so the read does not trigger an early autoflush.
+    row = (
+        await db.execute(
+            select(Learner.id, LearnerProfile)
+            .outerjoin(LearnerProfile, LearnerProfile.learner_id == Learner.id)
+            .where(Learner.id == payload.learner_id)
+        )
+    ).first()
+    if row is None:
         raise HTTPException(status_code=404, detail="Learner not found.")
+    profile = row.LearnerProfile
     _log_engagement_event(
         db=db,
         learner_id=payload.learner_id,
@@ -2024,9 +2240,6 @@ async def ingest_engagement_event(payload: EngagementEventRequest, db: AsyncSess
         duration_minutes=payload.duration_minutes,
         details=payload.details,
     )
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == payload.learner_id))
-    ).scalar_one_or_none()
     if profile is not None and payload.event_type in ("study", "task_completion", "test_submission"):
         await _update_profile_after_outcome(
             db=db,
@@ -2037,6 +2250,7 @@ async def ingest_engagement_event(payload: EngagementEventRequest, db: AsyncSess
             extra={"event_type": payload.event_type},
         )
     await db.commit()
+    await invalidate_learner_engagement_stats(payload.learner_id)
     return EngagementEventResponse(
         learner_id=payload.learner_id,
         event_type=payload.event_type,
@@ -2050,37 +2264,15 @@ async def get_engagement_summary(learner_id: UUID, db: AsyncSession = Depends(ge
     learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
     if learner is None:
         raise HTTPException(status_code=404, detail="Learner not found.")
-    now = datetime.now(timezone.utc)
-    day_start = now - timedelta(days=1)
-    week_start = now - timedelta(days=7)
-    minutes_today = await _engagement_minutes_since(db, learner_id, day_start)
-    minutes_week = await _engagement_minutes_since(db, learner_id, week_start)
-    adherence_rate = await _compute_adherence_rate_week(db, learner_id)
-    login_streak_days = await _compute_login_streak_days(db, learner_id)
-    last_login = (
-        await db.execute(
-            select(EngagementEvent.created_at)
-            .where(EngagementEvent.learner_id == learner_id, EngagementEvent.event_type == "login")
-            .order_by(EngagementEvent.created_at.desc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
-    last_logout = (
-        await db.execute(
-            select(EngagementEvent.created_at)
-            .where(EngagementEvent.learner_id == learner_id, EngagementEvent.event_type == "logout")
-            .order_by(EngagementEvent.created_at.desc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
+    stats = await _learner_engagement_stats(db, learner_id)
     return EngagementSummaryResponse(
         learner_id=learner_id,
-        engagement_minutes_today=minutes_today,
-        engagement_minutes_week=minutes_week,
-        login_streak_days=login_streak_days,
-        adherence_rate_week=adherence_rate,
-        last_login_at=last_login,
-        last_logout_at=last_logout,
+        engagement_minutes_today=stats.minutes_today,
+        engagement_minutes_week=stats.minutes_week,
+        login_streak_days=stats.login_streak_days,
+        adherence_rate_week=stats.adherence_rate_week,
+        last_login_at=stats.last_login_at,
+        last_logout_at=stats.last_logout_at,
     )
 
 
@@ -2176,84 +2368,109 @@ async def list_reminder_logs(learner_id: UUID, db: AsyncSession = Depends(get_db
     }
 
 
-@router.get("/profile-history/{learner_id}")
-async def get_profile_history(learner_id: UUID, db: AsyncSession = Depends(get_db)):
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    if learner is None:
+async def _ensure_learner_exists(db: AsyncSession, learner_id: UUID) -> None:
+    """404 unless the learner exists.
+
+    List reads call this only when their main query came back empty, so the
+    common (non-empty) path costs a single round-trip.
+    """
+    found = (await db.execute(select(Learner.id).where(Learner.id == learner_id))).scalar_one_or_none()
+    if found is None:
         raise HTTPException(status_code=404, detail="Learner not found.")
+
+
+@router.get("/profile-history/{learner_id}", response_class=ORJSONResponse)
+async def get_profile_history(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     rows = (
         await db.execute(
-            select(LearnerProfileSnapshot)
+            select(
+                LearnerProfileSnapshot.reason,
+                LearnerProfileSnapshot.created_at,
+                LearnerProfileSnapshot.payload,
+            )
             .where(LearnerProfileSnapshot.learner_id == learner_id)
             .order_by(LearnerProfileSnapshot.created_at.desc())
             .limit(50)
         )
-    ).scalars().all()
-    return {
+    ).all()
+    if not rows:
+        await _ensure_learner_exists(db, learner_id)
+    # payload is a NOT NULL JSONB column only ever written from dicts, so it is
+    # passed through as decoded rather than re-checked and copied per row.
+    return ORJSONResponse({
         "learner_id": learner_id,
         "items": [
             {
                 "reason": row.reason,
                 "created_at": row.created_at.isoformat() if row.created_at else None,
-                "payload": row.payload if isinstance(row.payload, dict) else {},
+                "payload": row.payload,
             }
             for row in rows
         ],
-    }
+    })
+
+
+async def _dashboard_profile_row(db: AsyncSession, learner_id: UUID, *extra_columns) -> Row | None:
+    """Profile fields read by the dashboard endpoints, as a plain row (no ORM instance).
+
+    ``extra_columns`` (typically labelled scalar subqueries) ride along in the
+    same round-trip.
+    """
+    return (
+        await db.execute(
+            select(
+                LearnerProfile.concept_mastery,
+                LearnerProfile.cognitive_depth,
+                LearnerProfile.engagement_score,
+                LearnerProfile.selected_timeline_weeks,
+                LearnerProfile.current_forecast_weeks,
+                *extra_columns,
+            ).where(LearnerProfile.learner_id == learner_id)
+        )
+    ).first()
 
 
-@router.get("/where-i-stand/{learner_id}", response_model=LearnerStandResponse)
+@router.get(
+    "/where-i-stand/{learner_id}",
+    response_class=ORJSONResponse,
+    responses={200: {"model": LearnerStandResponse}},
+)
 async def get_where_i_stand(learner_id: UUID, db: AsyncSession = Depends(get_db)):
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == learner_id))
-    ).scalar_one_or_none()
-    if learner is None or profile is None:
+    # learner_profile.learner_id is the primary key and a cascading FK to
+    # learners, so finding the profile row doubles as the learner check.
+    profile = await _dashboard_profile_row(db, learner_id)
+    if profile is None:
         raise HTTPException(status_code=404, detail="Learner profile not found.")
 
-    mastery_map = dict(profile.concept_mastery or {})
+    mastery_map = profile.concept_mastery or _EMPTY_MASTERY
     chapter_status = []
+    # Keys are unique and visited in sorted order, so both lists come out
+    # deduplicated and alphabetical without a second sort.
     strengths = []
     weaknesses = []
-    for chapter, value in sorted(mastery_map.items(), key=lambda item: item[0]):
+    for chapter, value in sorted(mastery_map.items()):
         score = float(value)
-        if score >= 0.85:
-            band = "Mastered"
-            strengths.append(chapter)
-        elif score >= 0.70:
-            band = "Proficient"
+        band_index = bisect_right(_MASTERY_BAND_THRESHOLDS, score)
+        if band_index >= 2:
             strengths.append(chapter)
-        elif score >= 0.45:
-            band = "Developing"
-        else:
-            band = "Beginner"
+        elif band_index == 0:
             weaknesses.append(chapter)
-        chapter_status.append({"chapter": chapter, "score": round(score, 3), "band": band})
+        chapter_status.append({"chapter": chapter, "score": round(score, 3), "band": _MASTERY_BANDS[band_index]})
 
     retention = await _compute_retention_score(db, learner_id)
-    adherence = await _compute_adherence_rate_week(db, learner_id)
-    confidence_score = round(
-        max(
-            0.0,
-            min(
-                1.0,
-                (0.45 * float(profile.cognitive_depth or 0.0))
-                + (0.25 * float(profile.engagement_score or 0.0))
-                + (0.20 * retention)
-                + (0.10 * adherence),
-            ),
-        ),
-        3,
-    )
-    return LearnerStandResponse(
-        learner_id=learner_id,
-        chapter_status=chapter_status,
-        concept_strengths=sorted(set(strengths))[:8],
-        concept_weaknesses=sorted(set(weaknesses))[:8],
-        confidence_score=confidence_score,
-        retention_score=retention,
-        adherence_rate_week=adherence,
-    )
+    adherence = (await _learner_engagement_stats(db, learner_id)).adherence_rate_week
+    confidence_score = _confidence_score(profile, retention, adherence)
+    # Every value is already a JSON primitive, so skip building LearnerStandResponse
+    # (still the documented shape) and let orjson encode the dict once.
+    return ORJSONResponse({
+        "learner_id": learner_id,
+        "chapter_status": chapter_status,
+        "concept_strengths": strengths[:8],
+        "concept_weaknesses": weaknesses[:8],
+        "confidence_score": confidence_score,
+        "retention_score": retention,
+        "adherence_rate_week": adherence,
+    })
 
 
 @router.get("/evaluation-analytics/{learner_id}", response_model=EvaluationAnalyticsResponse)
@@ -2281,49 +2498,30 @@ async def get_comparative_analytics(learner_id: UUID, db: AsyncSession = Depends
 @router.get("/learning-metrics/{learner_id}", response_model=StudentLearningMetricsResponse)
 async def get_student_learning_metrics(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     """Aggregated student-learning metrics: mastery, confidence, weak areas, adherence, streak, timeline."""
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == learner_id))
-    ).scalar_one_or_none()
-    if learner is None or profile is None:
+    retry_counts = (
+        select(func.jsonb_object_agg(ChapterProgression.chapter, ChapterProgression.attempt_count, type_=JSONB))
+        .where(ChapterProgression.learner_id == learner_id)
+        .scalar_subquery()
+        .label("chapter_retry_counts")
+    )
+    profile = await _dashboard_profile_row(db, learner_id, retry_counts)
+    if profile is None:
         raise HTTPException(status_code=404, detail="Learner profile not found.")
 
-    mastery_map = dict(profile.concept_mastery or {})
-    weak_areas = [ch for ch, val in mastery_map.items() if float(val) < 0.45]
-    avg_mastery = (
-        sum(float(v) for v in mastery_map.values()) / len(mastery_map)
-        if mastery_map
-        else 0.0
-    )
+    mastery_map = profile.concept_mastery or _EMPTY_MASTERY
+    weak_areas = [ch for ch, val in mastery_map.items() if float(val) < _WEAK_MASTERY_THRESHOLD]
+    # JSONB/ORM values may arrive as Decimal or None; coerce like the rest of the handler.
+    mastery_values = [float(v) for v in mastery_map.values() if v is not None]
+    avg_mastery = fmean(mastery_values) if mastery_values else 0.0
     retention = await _compute_retention_score(db, learner_id)
-    adherence = await _compute_adherence_rate_week(db, learner_id)
-    login_streak_days = await _compute_login_streak_days(db, learner_id)
-    confidence_score = round(
-        max(
-            0.0,
-            min(
-                1.0,
-                (0.45 * float(profile.cognitive_depth or 0.0))
-                + (0.25 * float(profile.engagement_score or 0.0))
-                + (0.20 * retention)
-                + (0.10 * adherence),
-            ),
-        ),
-        3,
-    )
+    engagement = await _learner_engagement_stats(db, learner_id)
+    adherence = engagement.adherence_rate_week
+    login_streak_days = engagement.login_streak_days
+    confidence_score = _confidence_score(profile, retention, adherence)
     selected_weeks = int(profile.selected_timeline_weeks or 0) or None
     forecast_weeks = int(profile.current_forecast_weeks or 0) or None
     delta = (forecast_weeks - selected_weeks) if (selected_weeks and forecast_weeks is not None) else None
 
-    progress_rows = (
-        await db.execute(
-            select(ChapterProgression.chapter, ChapterProgression.attempt_count).where(
-                ChapterProgression.learner_id == learner_id
-            )
-        )
-    ).all()
-    chapter_retry_counts = {row.chapter: int(row.attempt_count) for row in progress_rows}
-
     return StudentLearningMetricsResponse(
         learner_id=learner_id,
         mastery_progression=mastery_map,
@@ -2337,7 +2535,7 @@ async def get_student_learning_metrics(learner_id: UUID, db: AsyncSession = Depe
         forecast_drift_weeks=delta,
         selected_timeline_weeks=selected_weeks,
         current_forecast_weeks=forecast_weeks,
-        chapter_retry_counts=chapter_retry_counts,
+        chapter_retry_counts=profile.chapter_retry_counts or {},
     )
 
 
@@ -2348,17 +2546,22 @@ async def get_forecast_history(
     limit: int = 20,
 ):
     """Return weekly forecast history (drift trend over time) for the learner."""
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    if learner is None:
-        raise HTTPException(status_code=404, detail="Learner not found.")
     rows = (
         await db.execute(
-            select(WeeklyForecast)
+            select(
+                WeeklyForecast.week_number,
+                WeeklyForecast.current_forecast_weeks,
+                WeeklyForecast.timeline_delta_weeks,
+                WeeklyForecast.pacing_status,
+                WeeklyForecast.generated_at,
+            )
             .where(WeeklyForecast.learner_id == learner_id)
             .order_by(WeeklyForecast.generated_at.desc())
             .limit(min(limit, 50))
         )
-    ).scalars().all()
+    ).all()
+    if not rows:
+        await _ensure_learner_exists(db, learner_id)
     history = [
         ForecastHistoryItem(
             week_number=r.week_number,
@@ -2374,56 +2577,69 @@ async def get_forecast_history(
 
 @router.get("/daily-plan/{learner_id}", response_model=DailyPlanResponse)
 async def get_daily_plan(learner_id: UUID, db: AsyncSession = Depends(get_db)):
-    learner = (await db.execute(select(Learner).where(Learner.id == learner_id))).scalar_one_or_none()
-    if learner is None:
-        raise HTTPException(status_code=404, detail="Learner not found.")
-    plan = (
+    # Learner check, latest plan's week (plus only its week-start overrides, not the
+    # whole payload) and onboarding date in one round-trip; tasks follow in a second.
+    row = (
         await db.execute(
-            select(WeeklyPlan)
-            .where(WeeklyPlan.learner_id == learner_id)
-            .order_by(WeeklyPlan.generated_at.desc())
+            select(
+                Learner.id,
+                WeeklyPlan.current_week,
+                WeeklyPlan.plan_payload["week_start_overrides"].label("week_start_overrides"),
+                LearnerProfile.onboarding_date,
+            )
+            .outerjoin(WeeklyPlan, WeeklyPlan.learner_id == Learner.id)
+            .outerjoin(LearnerProfile, LearnerProfile.learner_id == Learner.id)
+            .where(Learner.id == learner_id)
+            .order_by(WeeklyPlan.generated_at.desc().nulls_last())
             .limit(1)
         )
-    ).scalar_one_or_none()
-    if plan is None:
+    ).first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Learner not found.")
+    if row.current_week is None:
         raise HTTPException(status_code=404, detail="No weekly plan found for learner.")
-    profile = (
-        await db.execute(select(LearnerProfile).where(LearnerProfile.learner_id == learner_id))
-    ).scalar_one_or_none()
-    onboarding_date = _resolve_onboarding_date(profile) if profile else canonical_today()
+    current_week = row.current_week
+    onboarding_date = row.onboarding_date or canonical_today()
     tasks = (
         await db.execute(
-            select(Task)
-            .where(Task.learner_id == learner_id, Task.week_number == plan.current_week)
+            select(*_DAILY_BREAKDOWN_TASK_COLUMNS)
+            .where(Task.learner_id == learner_id, Task.week_number == current_week)
             .order_by(Task.sort_order.asc(), Task.created_at.asc())
         )
-    ).scalars().all()
+    ).all()
     chapter = tasks[0].chapter if tasks else None
-    week_start_overrides = _extract_week_start_overrides(plan.plan_payload if isinstance(plan.plan_payload, dict) else {})
-    week_start, week_end = week_bounds_from_plan(onboarding_date, plan.current_week, week_start_overrides)
+    week_start_overrides = row.week_start_overrides if isinstance(row.week_start_overrides, dict) else {}
+    week_start, week_end = week_bounds_from_plan(onboarding_date, current_week, week_start_overrides)
     return DailyPlanResponse(
         learner_id=learner_id,
-        week_number=plan.current_week,
+        week_number=current_week,
         chapter=chapter,
-        week_label=format_week_label(plan.current_week, week_start, week_end),
+        week_label=format_week_label(current_week, week_start, week_end),
         week_start_date=week_start.isoformat(),
         week_end_date=week_end.isoformat(),
         is_committed_week=True,
         forecast_read_only=True,
-        daily_breakdown=_daily_breakdown_from_tasks(tasks, plan.current_week),
+        daily_breakdown=_daily_breakdown_from_tasks(tasks, current_week),
     )
 
 
-@router.get("/plan-versions/{learner_id}")
+@router.get("/plan-versions/{learner_id}", response_class=ORJSONResponse)
 async def list_plan_versions(learner_id: UUID, db: AsyncSession = Depends(get_db)):
     rows = (
         await db.execute(
-            select(WeeklyPlanVersion)
+            select(
+                WeeklyPlanVersion.version_number,
+                WeeklyPlanVersion.current_week,
+                WeeklyPlanVersion.reason,
+                WeeklyPlanVersion.created_at,
+            )
             .where(WeeklyPlanVersion.learner_id == learner_id)
             .order_by(WeeklyPlanVersion.version_number.asc(), WeeklyPlanVersion.created_at.asc())
         )
-    ).scalars().all()
-    return {
+    ).all()
+    if not rows:
+        await _ensure_learner_exists(db, learner_id)
+    return ORJSONResponse({
         "learner_id": learner_id,
         "versions": [
             {
@@ -2434,4 +2650,4 @@ async def list_plan_versions(learner_id: UUID, db: AsyncSession = Depends(get_db
             }
             for row in rows
         ],
-    }
+    })
@@ -114,6 +114,40 @@ async def initialize_database(session: AsyncSession, engine) -> None:
         await conn.execute(
             text("CREATE INDEX IF NOT EXISTS idx_engagement_events_event_type ON engagement_events (event_type)")
         )
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_engagement_events_learner_type_created "
+                "ON engagement_events (learner_id, event_type, created_at)"
+            )
+        )
+        await conn.execute(
+            text("CREATE INDEX IF NOT EXISTS idx_tasks_learner_created ON tasks (learner_id, created_at)")
+        )
+        # Latest-plan lookups; the composite index supersedes the learner_id-only one.
+        await conn.execute(
+            text(
+                "CREATE INDEX IF NOT EXISTS idx_weekly_plans_learner_generated "
+                "ON weekly_plans (learner_id, generated_at)"
+            )
+        )
+        await conn.execute(text("DROP INDEX IF EXISTS idx_weekly_plans_learner_id"))
+        # One progression row per learner chapter; the unique index supersedes the plain one.
+        # Legacy duplicates are collapsed once by alembic revision 20261017_0020, not here.
+        await conn.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_chapter_progression_learner_chapter "
+                "ON chapter_progression (learner_id, chapter)"
+            )
+        )
+        await conn.execute(text("DROP INDEX IF EXISTS idx_chapter_progression_learner_chapter"))
+        # At most one pending revision row per chapter; legacy duplicates are collapsed
+        # once by alembic revision 20261017_0019, not on every start.
+        await conn.execute(
+            text(
+                "CREATE UNIQUE INDEX IF NOT EXISTS uq_revision_queue_learner_chapter_pending "
+                "ON revision_queue (learner_id, chapter) WHERE status = 'pending'"
+            )
+        )
         await conn.execute(
             text(
                 "CREATE INDEX IF NOT EXISTS idx_reminder_logs_learner_created "
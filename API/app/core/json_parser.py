@@ -1,6 +1,8 @@
 import json
 import re
 
+import orjson
+
 
 def parse_llm_json(text: str):
     if not text:
@@ -20,3 +22,16 @@ def parse_llm_json(text: str):
         return json.loads(snippet)
     except Exception:
         return {}
+
+
+def extract_json_array(text: str):
+    """Parse the outermost ``[...]`` span of an LLM reply (prose/code fences ignored).
+
+    Returns ``None`` when the reply holds no array. Malformed JSON raises
+    ``orjson.JSONDecodeError``, a ``ValueError`` subclass, like ``json.loads``.
+    """
+    start = text.find("[")
+    end = text.rfind("]") + 1
+    if start < 0 or end <= start:
+        return None
+    return orjson.loads(text[start:end])
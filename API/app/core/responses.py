@@ -0,0 +1,24 @@
+"""
+Fast JSON response class backed by orjson.
+
+Handlers that build large plain-dict payloads (histories, metrics, dashboards)
+return this directly so the body is encoded once by orjson, skipping FastAPI's
+``jsonable_encoder`` walk. orjson serializes ``datetime`` and ``UUID`` values
+natively, so callers can pass them through without ``isoformat()``/``str()``.
+"""
+from __future__ import annotations
+
+import warnings
+
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.responses import ORJSONResponse as _FastAPIORJSONResponse
+
+# FastAPI deprecates its ORJSONResponse in favour of response_model serialization and
+# warns on every instantiation of that exact class. These handlers return plain dicts
+# with no response model, so subclass it once (rendering is inherited unchanged) to
+# keep the warning out of every request; only the definition itself would warn.
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", FastAPIDeprecationWarning)
+
+    class ORJSONResponse(_FastAPIORJSONResponse):
+        """FastAPI's ``ORJSONResponse`` without the per-response deprecation warning."""
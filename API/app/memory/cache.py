@@ -26,6 +26,23 @@ class _RedisMetricsWrapper:
         _record_get(out is not None)
         return out
 
+    async def getdel_and_mget(self, key: str, *keys: str):
+        """GETDEL ``key`` with its remaining TTL, and MGET ``keys``, in one round-trip.
+
+        Returns ``(value, ttl, values)``; the TTL lets a caller put ``key`` back if it
+        turns out not to be consumable after all.
+        """
+        async with self._client.pipeline() as pipe:
+            pipe.ttl(key)
+            pipe.getdel(key)
+            if keys:
+                pipe.mget(*keys)
+            ttl, consumed, *rest = await pipe.execute()
+        values = rest[0] if rest else []
+        for value in (consumed, *values):
+            _record_get(value is not None)
+        return consumed, ttl, values
+
     async def set(self, key: str, value: str, *args, **kwargs):
         _record_set()
         return await self._client.set(key, value, *args, **kwargs)
@@ -32,6 +32,9 @@ def _after_cursor_execute(conn, cursor, statement, parameters, context, executem
 # pool_size: max persistent connections in the pool (default 5)
 # max_overflow: additional temporary connections when pool is full (default 10)
 # pool_recycle: recycle connections after N seconds to prevent stale connections
+# query_cache_size: compiled-SQL cache entries (default 500); the API issues a few
+#   hundred distinct statement shapes plus per-dialect variants, so give it headroom
+#   to avoid evicting and recompiling hot dashboard queries
 #
 # For production with concurrent requests, increase pool_size to 10-20.
 # For development (low concurrency), defaults are fine.
@@ -41,6 +44,7 @@ engine = create_async_engine(
     pool_size=10,
     max_overflow=20,
     pool_recycle=1800,  # 30 minutes
+    query_cache_size=1200,
 )
 event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
 event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
@@ -2,7 +2,7 @@ import uuid
 from datetime import date, datetime
 
 from pgvector.sqlalchemy import Vector
-from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, func
+from sqlalchemy import Boolean, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -84,6 +84,7 @@ class EngagementEvent(Base):
     __table_args__ = (
         Index("idx_engagement_events_learner_created", "learner_id", "created_at"),
         Index("idx_engagement_events_event_type", "event_type"),
+        Index("idx_engagement_events_learner_type_created", "learner_id", "event_type", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -251,7 +252,8 @@ class IngestionRun(Base):
 class WeeklyPlan(Base):
     __tablename__ = "weekly_plans"
     __table_args__ = (
-        Index("idx_weekly_plans_learner_id", "learner_id"),
+        # Latest-plan lookups: learner_id filter, newest generated_at first (backward scan).
+        Index("idx_weekly_plans_learner_generated", "learner_id", "generated_at"),
         Index("idx_weekly_plans_generated_at", "generated_at"),
     )
 
@@ -290,7 +292,7 @@ class WeeklyPlanVersion(Base):
 class ChapterProgression(Base):
     __tablename__ = "chapter_progression"
     __table_args__ = (
-        Index("idx_chapter_progression_learner_chapter", "learner_id", "chapter"),
+        Index("uq_chapter_progression_learner_chapter", "learner_id", "chapter", unique=True),
         Index("idx_chapter_progression_status", "status"),
     )
 
@@ -362,6 +364,7 @@ class Task(Base):
     __table_args__ = (
         Index("idx_tasks_learner_week", "learner_id", "week_number"),
         Index("idx_tasks_status", "status"),
+        Index("idx_tasks_learner_created", "learner_id", "created_at"),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -406,6 +409,14 @@ class RevisionQueueItem(Base):
     __table_args__ = (
         Index("idx_revision_queue_learner_status", "learner_id", "status"),
         Index("idx_revision_queue_priority", "priority"),
+        # At most one pending entry per chapter; target of the ON CONFLICT upsert.
+        Index(
+            "uq_revision_queue_learner_chapter_pending",
+            "learner_id",
+            "chapter",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
     )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -0,0 +1,58 @@
+"""
+Diagnostic chunk cache — grounding chunks used to build onboarding diagnostics.
+
+Extracted from ``onboarding/routes.py`` so the grounding router can invalidate
+the cache after re-ingestion without importing the onboarding router.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.entities import EmbeddingChunk
+
+
+@dataclass(frozen=True, slots=True)
+class DiagnosticChunk:
+    """Detached copy of the ``EmbeddingChunk`` fields used to build diagnostic questions."""
+
+    chapter_number: int | None
+    content: str
+
+
+DIAGNOSTIC_CHUNKS_CACHE_TTL = 300.0  # seconds
+# Diagnostic grounding chunks change only on re-ingestion; see invalidate_diagnostic_chunks_cache.
+_diagnostic_chunks_cache: dict = {"value": None, "expires_at": 0.0}
+
+
+def invalidate_diagnostic_chunks_cache() -> None:
+    """Drop the cached chunks so the next diagnostic re-reads them.
+
+    The cache is per process: this only clears the calling worker. Other workers
+    keep serving their copy until ``DIAGNOSTIC_CHUNKS_CACHE_TTL`` expires.
+    """
+    _diagnostic_chunks_cache["value"] = None
+    _diagnostic_chunks_cache["expires_at"] = 0.0
+
+
+async def get_diagnostic_chunks(db: AsyncSession) -> list[DiagnosticChunk]:
+    """Return the first chapter chunks in reading order, cached in process."""
+    now = time.monotonic()
+    if _diagnostic_chunks_cache["value"] is not None and now < _diagnostic_chunks_cache["expires_at"]:
+        return _diagnostic_chunks_cache["value"]
+    rows = (
+        await db.execute(
+            select(EmbeddingChunk.chapter_number, EmbeddingChunk.content)
+            .where(EmbeddingChunk.doc_type == "chapter")
+            .order_by(EmbeddingChunk.chapter_number.asc(), EmbeddingChunk.chunk_index.asc())
+            .limit(9)
+        )
+    ).all()
+    chunks = [DiagnosticChunk(chapter_number=row.chapter_number, content=row.content) for row in rows]
+    if chunks:
+        _diagnostic_chunks_cache["value"] = chunks
+        _diagnostic_chunks_cache["expires_at"] = now + DIAGNOSTIC_CHUNKS_CACHE_TTL
+    return chunks
@@ -36,8 +36,20 @@ def keyword_tokens(text: str) -> set[str]:
 
 
 def is_near_duplicate(candidate: str, existing: list[str], threshold: float = 0.9) -> bool:
-    """Check if *candidate* is a near-duplicate of any entry in *existing*."""
-    return any(SequenceMatcher(a=candidate, b=prev).ratio() >= threshold for prev in existing)
+    """Check if *candidate* is a near-duplicate of any entry in *existing*.
+
+    ``real_quick_ratio`` and ``quick_ratio`` are cheap upper bounds on ``ratio``,
+    so clearly different stems skip the full matching-blocks comparison.
+    """
+    for prev in existing:
+        matcher = SequenceMatcher(a=candidate, b=prev)
+        if (
+            matcher.real_quick_ratio() >= threshold
+            and matcher.quick_ratio() >= threshold
+            and matcher.ratio() >= threshold
+        ):
+            return True
+    return False
 
 
 def question_looks_relevant(prompt: str, chapter_name: str, topic_titles: list[str]) -> bool:
@@ -74,7 +86,8 @@ def dedupe_generated_questions(
 ) -> tuple[list[dict], int]:
     """Drop exact/normalized/near-duplicate question stems from LLM output."""
     out: list[dict] = []
-    seen_norm: list[str] = []
+    seen_norm: set[str] = set()
+    seen_norm_list: list[str] = []
     duplicates_removed = 0
     for item in raw_items:
         if not isinstance(item, dict):
@@ -92,10 +105,14 @@ def dedupe_generated_questions(
         if not norm:
             duplicates_removed += 1
             continue
-        if norm in seen_norm or is_near_duplicate(norm, seen_norm):
+        if norm in seen_norm:
             duplicates_removed += 1
             continue
-        seen_norm.append(norm)
+        if is_near_duplicate(norm, seen_norm_list):
+            duplicates_removed += 1
+            continue
+        seen_norm.add(norm)
+        seen_norm_list.append(norm)
         out.append(item)
         if len(out) >= target_count:
             break
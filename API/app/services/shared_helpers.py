@@ -6,14 +6,18 @@ Moving them here provides a single source of truth and reduces route file size.
 """
 from __future__ import annotations
 
-import json
+import asyncio
 import logging
 import re
-from datetime import datetime, timezone
+import time
+from collections import OrderedDict
+from collections.abc import Coroutine
+from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Integer, cast, func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.selectable import ScalarSelect
 
 from app.core.logging import DOMAIN_COMPLIANCE, get_domain_logger
 from app.memory.cache import redis_client
@@ -72,29 +76,90 @@ async def generate_text_with_mcp(
 
 # ── Idempotency Cache ──────────────────────────────────────────────────
 
-_idempotency_cache: dict[str, dict] = {}
+IDEMPOTENCY_TTL_SECONDS = 3600
+IDEMPOTENCY_CACHE_MAX_ENTRIES = 10_000
 
+# In-memory fallback for Redis outages: insertion-ordered, bounded, and expiring
+# on the same TTL as the Redis copy so it cannot grow for the process lifetime.
+_idempotency_cache: OrderedDict[str, tuple[str | bytes, float]] = OrderedDict()
 
-async def get_idempotent_response(cache_key: str) -> dict | None:
-    """Check Redis (then in-memory) for a cached idempotent response."""
+
+def _idempotency_cache_get(cache_key: str) -> str | bytes | None:
+    entry = _idempotency_cache.get(cache_key)
+    if entry is None:
+        return None
+    payload, expires_at = entry
+    if time.monotonic() >= expires_at:
+        del _idempotency_cache[cache_key]
+        return None
+    return payload
+
+
+def _idempotency_cache_put(cache_key: str, payload: str | bytes) -> None:
+    _idempotency_cache[cache_key] = (payload, time.monotonic() + IDEMPOTENCY_TTL_SECONDS)
+    _idempotency_cache.move_to_end(cache_key)
+    while len(_idempotency_cache) > IDEMPOTENCY_CACHE_MAX_ENTRIES:
+        _idempotency_cache.popitem(last=False)
+
+
+async def get_idempotent_response(cache_key: str) -> str | bytes | None:
+    """Check Redis (then in-memory) for a cached idempotent response body.
+
+    The body is returned still encoded so callers can rebuild their response
+    model with ``model_validate_json`` in a single pass.
+    """
     try:
         raw = await redis_client.get(cache_key)
         if raw:
-            return json.loads(raw)
+            return raw
     except Exception as exc:
         logger.warning("Redis unavailable for idempotency read: %s", exc)
-    return _idempotency_cache.get(cache_key)
+    return _idempotency_cache_get(cache_key)
 
 
-async def set_idempotent_response(cache_key: str, payload: dict) -> None:
-    """Store an idempotent response in Redis + in-memory fallback."""
-    _idempotency_cache[cache_key] = payload
+async def set_idempotent_response(cache_key: str, payload: str | bytes) -> None:
+    """Store an encoded idempotent response body in Redis + in-memory fallback."""
+    _idempotency_cache_put(cache_key, payload)
     try:
-        await redis_client.set(cache_key, json.dumps(payload), ex=3600)
+        await redis_client.set(cache_key, payload, ex=IDEMPOTENCY_TTL_SECONDS)
     except Exception as exc:
         logger.warning("Redis unavailable for idempotency write: %s", exc)
 
 
+# ── Fire-and-forget Side Effects ───────────────────────────────────────
+
+# Strong refs so detached tasks are not garbage-collected mid-flight.
+_background_tasks: set[asyncio.Task] = set()
+
+
+def run_detached(coro: Coroutine[Any, Any, Any]) -> None:
+    """Schedule *coro* on the running loop without awaiting it."""
+    task = asyncio.create_task(coro)
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
+async def delete_cache_key_quietly(*keys: str) -> None:
+    """Delete Redis keys in one round-trip, ignoring Redis outages."""
+    try:
+        await redis_client.delete(*keys)
+    except Exception as exc:
+        logger.warning("Redis unavailable for cache invalidation keys=%s: %s", keys, exc)
+
+
+async def log_agent_decision_detached(**kwargs: Any) -> None:
+    """Record an agent decision in its own session (for use with ``run_detached``)."""
+    from app.agents.decision_logger import log_agent_decision
+    from app.memory.database import SessionLocal
+
+    try:
+        async with SessionLocal() as session:
+            await log_agent_decision(db=session, **kwargs)
+            await session.commit()
+    except Exception as exc:
+        logger.warning("Failed to persist detached agent decision: %s", exc)
+
+
 # ── Engagement Logging ─────────────────────────────────────────────────
 
 def log_engagement_event(
@@ -119,40 +184,47 @@ def log_engagement_event(
 
 # ── Login Streak ───────────────────────────────────────────────────────
 
-async def compute_login_streak_days(db: AsyncSession, learner_id: UUID) -> int:
-    """Count consecutive login days up to today."""
-    from datetime import timedelta
+def login_streak_days_subquery(learner_id: UUID) -> ScalarSelect[int]:
+    """Scalar subquery counting consecutive login days up to today.
 
+    Gaps-and-islands in SQL: over distinct UTC login days in descending order,
+    ``day + row_number()`` is constant within a run of consecutive days, so the
+    streak is the size of the run containing today (or yesterday). Exposed as a
+    subquery so callers can fold the streak into a larger single-row read.
+    """
     from app.models.entities import EngagementEvent
 
-    rows = (
-        await db.execute(
-            select(EngagementEvent.created_at)
-            .where(
-                EngagementEvent.learner_id == learner_id,
-                EngagementEvent.event_type == "login",
-            )
-            .order_by(EngagementEvent.created_at.desc())
-            .limit(60)
+    today_utc = func.date(func.timezone("UTC", func.now()))
+    login_day = func.date(func.timezone("UTC", EngagementEvent.created_at)).label("day")
+    days = (
+        select(login_day)
+        .where(
+            EngagementEvent.learner_id == learner_id,
+            EngagementEvent.event_type == "login",
         )
-    ).scalars().all()
-    if not rows:
-        return 0
-    dates = sorted({dt.astimezone(timezone.utc).date() for dt in rows}, reverse=True)
-    streak = 0
-    cursor = datetime.now(timezone.utc).date()
-    for login_day in dates:
-        if login_day == cursor:
-            streak += 1
-            cursor = cursor - timedelta(days=1)
-            continue
-        if streak == 0 and login_day == cursor - timedelta(days=1):
-            streak += 1
-            cursor = login_day - timedelta(days=1)
-            continue
-        if login_day < cursor:
-            break
-    return streak
+        .distinct()
+        .order_by(login_day.desc())
+        .limit(60)
+        .cte("login_days")
+    )
+    runs = select(
+        days.c.day,
+        (days.c.day + cast(func.row_number().over(order_by=days.c.day.desc()), Integer)).label("run"),
+    ).cte("login_runs")
+    current_run = (
+        select(runs.c.run)
+        .where(runs.c.day.in_([today_utc, today_utc - 1]))
+        .order_by(runs.c.day.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+    return select(func.count()).select_from(runs).where(runs.c.run == current_run).scalar_subquery()
+
+
+async def compute_login_streak_days(db: AsyncSession, learner_id: UUID) -> int:
+    """Count consecutive login days up to today (see ``login_streak_days_subquery``)."""
+    streak = (await db.execute(select(login_streak_days_subquery(learner_id)))).scalar_one()
+    return int(streak or 0)
 
 
 # ── Revision Queue ─────────────────────────────────────────────────────
@@ -165,29 +237,26 @@ async def upsert_revision_queue_item(
     reason: str,
     priority: int = 1,
 ) -> None:
-    """Insert or update a revision queue entry for a learner."""
+    """Insert or update a revision queue entry for a learner (single ON CONFLICT upsert)."""
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
+
     from app.models.entities import RevisionQueueItem
 
-    existing = (
-        await db.execute(
-            select(RevisionQueueItem).where(
-                RevisionQueueItem.learner_id == learner_id,
-                RevisionQueueItem.chapter == chapter,
-                RevisionQueueItem.status == "pending",
-            )
-        )
-    ).scalar_one_or_none()
-    if existing:
-        existing.priority = max(existing.priority, priority)
-        existing.reason = reason
-        existing.updated_at = datetime.now(timezone.utc)
-        return
-    db.add(
-        RevisionQueueItem(
-            learner_id=learner_id,
-            chapter=chapter,
-            status="pending",
-            priority=priority,
-            reason=reason,
-        )
+    stmt = pg_insert(RevisionQueueItem).values(
+        learner_id=learner_id,
+        chapter=chapter,
+        status="pending",
+        priority=priority,
+        reason=reason,
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[RevisionQueueItem.learner_id, RevisionQueueItem.chapter],
+        # Literal predicate so Postgres can infer the partial unique index.
+        index_where=text("status = 'pending'"),
+        set_={
+            "priority": func.greatest(RevisionQueueItem.priority, stmt.excluded.priority),
+            "reason": stmt.excluded.reason,
+            "updated_at": func.now(),
+        },
     )
+    await db.execute(stmt)
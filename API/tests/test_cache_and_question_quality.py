@@ -2,6 +2,8 @@ from app.api.learning.schemas import TestQuestion as LearningTestQuestion
 from app.api.learning.routes import (
     _chapter_test_cache_key,
     _dedupe_generated_questions,
+    _is_near_duplicate,
+    _normalized_question_text,
     _question_set_is_high_quality,
     _reading_content_is_high_quality,
     _section_content_cache_key,
@@ -63,6 +65,21 @@ def test_dedupe_filters_duplicates_irrelevant_and_invalid_options():
     assert any("solve x + y = 10" in p.lower() for p in prompts)
 
 
+def test_near_duplicate_matches_character_similarity_not_token_overlap():
+    def norm(text: str) -> str:
+        return _normalized_question_text(text)
+
+    base = norm("[Q1] Which statement is true for 'Euclid's Division Lemma'?")
+    assert _is_near_duplicate(norm("[Q5] Which statement is true for 'Euclid's Division Lemma'?"), [base]) is True
+    assert _is_near_duplicate(norm("[Q2] Identify the incorrect claim about 'Euclid's Division Lemma'."), [base]) is False
+    # Shared numbers and words, different questions.
+    hcf = norm("find the hcf of 96 and 404 using euclid algorithm")
+    assert _is_near_duplicate(norm("find the lcm of 96 and 404 using prime factorisation"), [hcf]) is False
+    # Same question with different coefficients.
+    zeroes = norm("find the zeroes of x^2-5x+6")
+    assert _is_near_duplicate(norm("find the zeroes of x^2-7x+12"), [zeroes]) is True
+
+
 def test_reading_quality_gate_rejects_placeholder_content():
     bad = "# Intro\n\nCorrect definition of topic.\nIncorrect variant."
     good = (
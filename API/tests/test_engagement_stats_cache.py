@@ -0,0 +1,96 @@
+import asyncio
+from datetime import date, datetime, timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+
+from app.api.learning import routes as learning_routes
+from app.api.onboarding import routes as onboarding_routes
+from app.services import shared_helpers
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store: dict[str, str] = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    async def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(onboarding_routes, "redis_client", redis)
+    monkeypatch.setattr(shared_helpers, "redis_client", redis)
+    return redis
+
+
+def test_learner_engagement_stats_are_cached_until_invalidated(fake_redis):
+    row = SimpleNamespace(
+        minutes_today=5,
+        minutes_week=40,
+        completed=1,
+        total=4,
+        login_streak_days=3,
+        last_login=datetime(2026, 10, 16, 8, 30, tzinfo=timezone.utc),
+        last_logout=None,
+    )
+    result = MagicMock()
+    result.one.return_value = row
+    db = SimpleNamespace(execute=AsyncMock(return_value=result))
+    learner_id = uuid4()
+
+    first = asyncio.run(onboarding_routes._learner_engagement_stats(db, learner_id))
+    second = asyncio.run(onboarding_routes._learner_engagement_stats(db, learner_id))
+    assert first == second
+    assert first.adherence_rate_week == 0.25
+    assert db.execute.await_count == 1
+
+    asyncio.run(onboarding_routes.invalidate_learner_engagement_stats(learner_id))
+    asyncio.run(onboarding_routes._learner_engagement_stats(db, learner_id))
+    assert db.execute.await_count == 2
+
+
+def test_advance_week_drops_cached_engagement_stats(fake_redis, monkeypatch):
+    learner_id = uuid4()
+    profile = SimpleNamespace(
+        concept_mastery={},
+        cognitive_depth=0.5,
+        selected_timeline_weeks=14,
+        recommended_timeline_weeks=14,
+        current_forecast_weeks=14,
+        timeline_delta_weeks=0,
+        onboarding_date=date(2026, 10, 1),
+    )
+    plan = SimpleNamespace(
+        id=uuid4(),
+        current_week=1,
+        total_weeks=14,
+        plan_payload={"rough_plan": [{"week": 1, "chapter": "Chapter 1", "focus": "learn + practice"}]},
+    )
+    monkeypatch.setattr(learning_routes, "_get_profile", AsyncMock(return_value=profile))
+    monkeypatch.setattr(learning_routes, "_get_plan", AsyncMock(return_value=plan))
+    monkeypatch.setattr(learning_routes, "log_agent_decision_detached", AsyncMock())
+    empty = MagicMock()
+    empty.scalars.return_value.all.return_value = []
+    empty.scalar_one_or_none.return_value = None
+    db = MagicMock(execute=AsyncMock(return_value=empty), commit=AsyncMock())
+    fake_redis.store[f"learning:engagement:{learner_id}"] = "{}"
+
+    async def _advance():
+        response = await learning_routes.advance_week(learner_id, db)
+        await asyncio.sleep(0)  # let the detached invalidation run
+        return response
+
+    response = asyncio.run(_advance())
+    assert response.new_week == 2
+    assert f"learning:engagement:{learner_id}" not in fake_redis.store
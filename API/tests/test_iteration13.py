@@ -220,3 +220,56 @@ class TestMCPContracts:
         resp = MCPResponse(operation="test", ok=False, error="timeout")
         assert resp.ok is False
         assert resp.error == "timeout"
+
+
+# ── shared_helpers ───────────────────────────────────────────────────
+
+class TestIdempotencyFallbackCache:
+    """Tests for the bounded in-memory idempotency fallback."""
+
+    def test_evicts_oldest_beyond_max_entries(self, monkeypatch):
+        from app.services import shared_helpers
+        monkeypatch.setattr(shared_helpers, "_idempotency_cache", shared_helpers.OrderedDict())
+        monkeypatch.setattr(shared_helpers, "IDEMPOTENCY_CACHE_MAX_ENTRIES", 2)
+        for key in ("a", "b", "c"):
+            shared_helpers._idempotency_cache_put(key, f'{{"key": "{key}"}}')
+        assert shared_helpers._idempotency_cache_get("a") is None
+        assert shared_helpers._idempotency_cache_get("c") == '{"key": "c"}'
+
+    def test_expired_entry_is_dropped(self, monkeypatch):
+        from app.services import shared_helpers
+        monkeypatch.setattr(shared_helpers, "_idempotency_cache", shared_helpers.OrderedDict())
+        monkeypatch.setattr(shared_helpers, "IDEMPOTENCY_TTL_SECONDS", -1)
+        shared_helpers._idempotency_cache_put("k", '{"ok": true}')
+        assert shared_helpers._idempotency_cache_get("k") is None
+        assert "k" not in shared_helpers._idempotency_cache
+
+
+# ── memory.cache ─────────────────────────────────────────────────────
+
+class TestRedisMetricsWrapper:
+    """Tests for the pipelined consume-and-read helper."""
+
+    def test_getdel_and_mget_uses_one_pipeline(self):
+        from app.memory.cache import _RedisMetricsWrapper
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[6900, '{"answer_key": {}}', ['{"name": "x"}']])
+        client = MagicMock()
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        consumed, ttl, values = asyncio.run(_RedisMetricsWrapper(client).getdel_and_mget("attempt", "draft"))
+        assert consumed == '{"answer_key": {}}'
+        assert ttl == 6900
+        assert values == ['{"name": "x"}']
+        client.pipeline.assert_called_once_with()
+        pipe.ttl.assert_called_once_with("attempt")
+        pipe.getdel.assert_called_once_with("attempt")
+        pipe.mget.assert_called_once_with("draft")
+
+    def test_getdel_and_mget_skips_mget_without_keys(self):
+        from app.memory.cache import _RedisMetricsWrapper
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[-2, None])
+        client = MagicMock()
+        client.pipeline.return_value.__aenter__.return_value = pipe
+        assert asyncio.run(_RedisMetricsWrapper(client).getdel_and_mget("attempt")) == (None, -2, [])
+        pipe.mget.assert_not_called()
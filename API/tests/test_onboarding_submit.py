@@ -0,0 +1,29 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+
+from app.api.onboarding import routes
+from app.schemas.onboarding import OnboardingSubmitRequest
+
+
+def test_rejected_submit_restores_attempt_with_remaining_ttl(monkeypatch):
+    attempt_raw = '{"answer_key": {"q_0": "a"}, "selected_timeline_weeks": 16}'
+    fake_redis = MagicMock()
+    fake_redis.getdel_and_mget = AsyncMock(return_value=(attempt_raw, 5400, []))
+    fake_redis.set = AsyncMock()
+    monkeypatch.setattr(routes, "redis_client", fake_redis)
+    result = MagicMock()
+    result.first.return_value = None
+    db = MagicMock(execute=AsyncMock(return_value=result))
+    payload = OnboardingSubmitRequest(
+        learner_id=uuid4(),
+        diagnostic_attempt_id="attempt-1",
+        answers=[{"question_id": "q_0", "answer": "a"}],
+    )
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(routes.submit_onboarding(payload, db))
+    assert exc.value.status_code == 404
+    fake_redis.set.assert_awaited_once_with("onboarding:attempt:attempt-1", attempt_raw, ex=5400)
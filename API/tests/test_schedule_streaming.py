@@ -0,0 +1,21 @@
+import asyncio
+import json
+from uuid import uuid4
+
+from app.api.onboarding.routes import _iter_schedule_ndjson
+
+
+def test_schedule_ndjson_emits_summary_then_one_line_per_week():
+    task_id = uuid4()
+    weeks = [
+        {"week_number": 1, "tasks": [{"task_id": str(task_id), "week_number": 1}]},
+        {"week_number": 2, "tasks": []},
+    ]
+
+    async def _collect():
+        return [chunk async for chunk in _iter_schedule_ndjson({"learner_id": task_id, "current_week": 1}, weeks)]
+
+    lines = [json.loads(chunk) for chunk in asyncio.run(_collect())]
+    assert lines[0] == {"learner_id": str(task_id), "current_week": 1}
+    assert [line["week_number"] for line in lines[1:]] == [1, 2]
+    assert lines[1]["tasks"][0]["task_id"] == str(task_id)
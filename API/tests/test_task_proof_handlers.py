@@ -0,0 +1,20 @@
+from uuid import uuid4
+
+from app.api.onboarding.routes import _PROOF_HANDLERS, _notes_proof
+from app.schemas.onboarding import TaskCompletionRequest
+
+
+def test_proof_handlers_match_task_type_policies():
+    learner_id = uuid4()
+    short_read = TaskCompletionRequest(learner_id=learner_id, reading_minutes=5)
+    assert _PROOF_HANDLERS["read"]({"min_reading_minutes": 10}, short_read) == (
+        False,
+        "min_reading_minutes_10_required",
+    )
+    assert _PROOF_HANDLERS["practice"]({}, short_read) == (True, "reading_proof_ok")
+
+    no_attempt = TaskCompletionRequest(learner_id=learner_id, test_attempt_id="  ")
+    assert _PROOF_HANDLERS["test"]({}, no_attempt) == (False, "test_attempt_id_required")
+    assert _PROOF_HANDLERS["test"]({"require_test_attempt_id": False}, no_attempt) == (True, "test_proof_ok")
+
+    assert _PROOF_HANDLERS.get("revision", _notes_proof)({}, short_read) == (False, "notes_required")
@@ -154,9 +154,13 @@ def test_app_metrics_endpoint_contract(client):
 
 
 def test_mcp_dispatch_observability_on_session_flow(client):
+    from app.api import metrics as metrics_routes
+
     learner_id = str(uuid.uuid4())
     start = client.post("/start-session", json={"learner_id": learner_id})
     assert start.status_code == 200
+    # Drop any snapshot taken before this session so the counters include it.
+    metrics_routes._app_metrics_snapshot["expires_at"] = 0.0
     metrics = client.get("/metrics/app")
     assert metrics.status_code == 200
     mcp = metrics.json().get("mcp", {})